@@ -0,0 +1,84 @@
+"""Startup and per-request DTO cost, with and without Litestar's codegen transfer backend.
+
+Run with ``python -m benchmarks.dto``. Each backend is measured in a fresh interpreter so that neither benefits from
+the other's DTO registry.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+ROUNDS = 2000
+ITEMS = 100
+
+
+def measure(codegen: bool) -> dict[str, float]:
+    from src.router.utils.dto import DTOGenerator, get_dto
+
+    DTOGenerator.base_read_kwargs["experimental_codegen_backend"] = codegen
+    DTOGenerator.base_write_kwargs["experimental_codegen_backend"] = codegen
+
+    start = time.perf_counter()
+    from litestar.serialization import encode_json
+    from litestar.typing import FieldDefinition
+
+    from src.app import app
+    from src.model import Vocabulary
+    from src.router.utils.pagination import CursorPage
+
+    startup = time.perf_counter() - start
+
+    handlers = {
+        method: handler
+        for route in app.routes
+        if route.path == "/vocabulary"
+        for method, (handler, _) in route.route_handler_map.items()  # type: ignore[attr-defined]
+    }
+    create = handlers["POST"]
+    connection: Any = SimpleNamespace(route_handler=create, content_type=None)
+    write_backend = create.resolve_data_dto()._dto_backends[create.handler_id]["data_backend"]
+
+    body = json.dumps({"title": "Leaf", "namespace": "APPN", "externalReference": "PO:0025034"}).encode()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        write_backend.populate_data_from_raw(body, connection)
+    decode = (time.perf_counter() - start) / ROUNDS
+
+    # Handlers encode reads from Structs, so the read DTO of the registry is bound to a page type here
+    read_dto = get_dto(Vocabulary, **DTOGenerator.base_read_kwargs)
+    page_type = FieldDefinition.from_annotation(CursorPage[Vocabulary])
+    read_dto.create_for_field_definition(page_type, "benchmark")
+    read_backend = read_dto._dto_backends["benchmark"]["return_backend"]
+    items = [Vocabulary(id=uuid4(), title=f"Term {index}", namespace="APPN") for index in range(ITEMS)]
+    start = time.perf_counter()
+    for _ in range(ROUNDS // 10):
+        encode_json(read_backend.encode_data(CursorPage(items=items, limit=ITEMS)))
+    encode = (time.perf_counter() - start) / (ROUNDS // 10)
+    return {"startup_ms": startup * 1e3, "decode_us": decode * 1e6, "encode_page_us": encode * 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", choices=("codegen", "default"))
+    args = parser.parse_args()
+    if args.backend:
+        print(json.dumps(measure(args.backend == "codegen")))
+        return
+    print(f"{'backend':<10}{'startup (ms)':>15}{'decode (us)':>15}{f'encode {ITEMS} (us)':>20}")
+    for backend in ("default", "codegen"):
+        command = [sys.executable, "-m", "benchmarks.dto", "--backend", backend]
+        # This module again, with fixed arguments
+        output = subprocess.run(command, capture_output=True, check=True, text=True)  # noqa: S603
+        result = json.loads(output.stdout.splitlines()[-1])
+        print(
+            f"{backend:<10}{result['startup_ms']:>15.1f}{result['decode_us']:>15.1f}{result['encode_page_us']:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Throughput of cached lists and items versus reading and encoding every response.
+
+Run with ``python -m benchmarks.lists``.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+from uuid import UUID
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.helpers import PRODUCTION, SQLiteReaderPlugin, create_db_config, provide_transaction
+from src.model import Base, Unit
+from src.router import UnitController
+from src.router.utils.cache import LRUStore
+
+ROUNDS = 1000
+UNITS = 100
+
+
+class UncachedUnitController(UnitController):
+    cache_lists = False
+    cache_items = False
+
+
+async def seed(path: Path) -> UUID:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        units = [Unit(name=f"Unit {index}", symbol=f"u{index}") for index in range(UNITS)]
+        session.add_all(units)
+        await session.flush()
+        unit_id = units[0].id
+        await session.commit()
+    await engine.dispose()
+    return unit_id
+
+
+async def measure(path: Path, unit_id: UUID, controller: type[UnitController]) -> dict[str, float]:
+    store = LRUStore()
+    app = Litestar(
+        [controller],
+        dependencies={"transaction": provide_transaction},
+        plugins=[
+            SQLAlchemyPlugin(create_db_config(str(path), profile=PRODUCTION)),
+            SQLiteReaderPlugin(str(path), PRODUCTION),
+        ],
+        stores={"response_cache": store},
+    )
+    results = {}
+    async with AsyncTestClient(app=app) as client:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        for name, url in (("list", "/unit"), ("by id", f"/unit/{unit_id}")):
+            await client.get(url)
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                await client.get(url)
+            results[name] = ROUNDS / (time.perf_counter() - start)
+    return results
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.sqlite"
+        unit_id = await seed(path)
+        controllers = {"read": UncachedUnitController, "cached": UnitController}
+        results = {name: await measure(path, unit_id, controller) for name, controller in controllers.items()}
+    print(f"{'response':<15}{'list (req/s)':>16}{'by id (req/s)':>16}")
+    for name, result in results.items():
+        print(f"{name:<15}{result['list']:>16.0f}{result['by id']:>16.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Read throughput with the write transaction on every request versus the read-only pool for safe methods.
+
+Run with ``python -m benchmarks.reads``.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import autocommit_before_send_handler
+from litestar import Litestar
+from litestar.config.app import AppConfig
+from litestar.di import Provide
+from litestar.testing import AsyncTestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.helpers import PRODUCTION, SQLiteReaderPlugin, create_db_config, provide_transaction
+from src.model import Base, Investigation, Study
+from src.router import StudyController
+
+ROUNDS = 500
+STUDIES = 100
+
+
+class UncachedStudyController(StudyController):
+    cache_items = False
+
+
+async def seed(path: Path) -> UUID:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        investigation = Investigation(title="Benchmark")
+        session.add(investigation)
+        await session.flush()
+        now = datetime.now(UTC)
+        studies = [
+            Study(title=f"Study {index}", objective="Time", start_date=now, investigation_id=investigation.id)
+            for index in range(STUDIES)
+        ]
+        session.add_all(studies)
+        await session.flush()
+        study_id = studies[0].id
+        await session.commit()
+    await engine.dispose()
+    return study_id
+
+
+async def provide_write_session(db_session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    # The previous behaviour: reads go through the write transaction under a key of their own
+    async for session in provide_transaction(db_session):
+        yield session
+
+
+class WriteSessionPlugin(SQLiteReaderPlugin):
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        app_config = super().on_app_init(app_config)
+        app_config.dependencies["read_session"] = Provide(provide_write_session)
+        return app_config
+
+
+async def measure(path: Path, study_id: UUID, read_only: bool) -> dict[str, float]:
+    db_config = create_db_config(str(path), profile=PRODUCTION)
+    if not read_only:
+        db_config.before_send_handler = autocommit_before_send_handler
+    app = Litestar(
+        [UncachedStudyController],
+        dependencies={"transaction": provide_transaction},
+        plugins=[
+            SQLAlchemyPlugin(db_config),
+            (SQLiteReaderPlugin if read_only else WriteSessionPlugin)(str(path), PRODUCTION),
+        ],
+    )
+    results = {}
+    async with AsyncTestClient(app=app) as client:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        for name, url in (("by id", f"/study/{study_id}"), ("page", "/study")):
+            await client.get(url)
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                await client.get(url)
+            results[name] = ROUNDS / (time.perf_counter() - start)
+    return results
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.sqlite"
+        study_id = await seed(path)
+        results = {
+            name: await measure(path, study_id, read_only)
+            for name, read_only in (("transaction", False), ("read-only", True))
+        }
+    print(f"{'session':<15}{'by id (req/s)':>16}{'page (req/s)':>16}")
+    for name, result in results.items():
+        print(f"{name:<15}{result['by id']:>16.0f}{result['page']:>16.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""Encode throughput and memory per item: dataclass + DTO transfer versus the generated msgspec Structs.
+
+Run with ``python -m benchmarks.serialise``.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import msgspec
+from litestar.serialization import encode_json
+
+from src.app import app
+from src.model import ObservationUnit
+from src.router import ObservationUnitController
+from src.router.utils.struct import dataclass_struct, to_struct
+
+ITEMS = 10000
+RELATED = {"parent_id": 1, "study_id": 2, "experimental_factor_id": 3}
+
+
+def make_rows() -> list[tuple[Any, dict[str, list[Any]]]]:
+    now = datetime.now(UTC)
+    return [
+        (
+            ObservationUnit(id=uuid4(), title=f"Plant {index}", location="Bay 1", created_at=now, updated_at=now),
+            {attr: [uuid4() for _ in range(count)] for attr, count in RELATED.items()},
+        )
+        for index in range(ITEMS)
+    ]
+
+
+def dto_path() -> Callable[[list[Any]], bytes]:
+    handler = next(
+        handler
+        for route in app.routes
+        if route.path == ObservationUnitController.path
+        for method, (handler, _) in route.route_handler_map.items()  # type: ignore[attr-defined]
+        if method == "POST"
+    )
+    backend = handler.resolve_return_dto()._dto_backends[handler.handler_id]["return_backend"]
+    controller = SimpleNamespace(
+        attr_map=ObservationUnitController.attr_map, dataclass=ObservationUnitController.dataclass
+    )
+
+    def encode(rows: list[Any]) -> bytes:
+        items = []
+        for item, related in rows:
+            data = item.to_dict()
+            data.update(related)
+            items.append(backend.encode_data(controller.dataclass(**data)))
+        return encode_json(items)
+
+    return encode
+
+
+def struct_path() -> Callable[[list[Any]], bytes]:
+    struct = dataclass_struct(ObservationUnitController.dataclass)
+    encoder = msgspec.json.Encoder()
+
+    def encode(rows: list[Any]) -> bytes:
+        items = []
+        for item, related in rows:
+            result = to_struct(struct, item)
+            for attr, ids in related.items():
+                setattr(result, attr, ids)
+            items.append(result)
+        return encoder.encode(items)
+
+    return encode
+
+
+def measure(encode: Callable[[list[Any]], bytes], rows: list[Any]) -> tuple[float, float]:
+    encode(rows[:100])
+    start = time.perf_counter()
+    encode(rows)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    encode(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ITEMS / elapsed, peak / ITEMS
+
+
+def main() -> None:
+    rows = make_rows()
+    print(f"{'path':<10}{'items/s':>12}{'peak bytes/item':>18}")
+    for name, encode in (("dto", dto_path()), ("struct", struct_path())):
+        throughput, memory = measure(encode, rows)
+        print(f"{name:<10}{throughput:>12.0f}{memory:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
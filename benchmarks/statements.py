@@ -0,0 +1,93 @@
+"""CPU per by-id read: a statement rebuilt on every call versus the cached one with a bound id.
+
+Run with ``python -m benchmarks.statements``. Both paths are measured through ``read_item_by_id``'s query, and the
+cached path also end to end through ``GET /study/{id}``.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.helpers import PRODUCTION, SQLiteReaderPlugin, create_db_config, provide_transaction
+from src.model import Base, Investigation, Study
+from src.router import StudyController
+from src.router.base import read_item_by_id
+
+ROUNDS = 2000
+
+
+class UncachedStudyController(StudyController):
+    cache_items = False
+
+
+async def rebuilt(session: AsyncSession, table: type[Any], id: UUID) -> Any:
+    result = await session.execute(select(table).where(table.__table__.c.id == id))
+    return result.scalars().one()
+
+
+async def measure_helpers(path: Path) -> tuple[UUID, dict[str, float]]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        investigation = Investigation(title="Benchmark")
+        session.add(investigation)
+        await session.flush()
+        study = Study(title="Study", objective="Time", start_date=datetime.now(UTC), investigation_id=investigation.id)
+        session.add(study)
+        await session.flush()
+        study_id = study.id
+        await session.commit()
+        results = {}
+        for name, read in (("rebuilt", rebuilt), ("cached", read_item_by_id)):
+            await read(session, Study, study_id)
+            start = time.process_time()
+            for _ in range(ROUNDS):
+                await read(session, Study, study_id)
+            results[name] = (time.process_time() - start) / ROUNDS * 1e6
+    await engine.dispose()
+    return study_id, results
+
+
+async def measure_request(path: Path, study_id: UUID) -> float:
+    app = Litestar(
+        [UncachedStudyController],
+        dependencies={"transaction": provide_transaction},
+        plugins=[
+            SQLAlchemyPlugin(create_db_config(str(path), profile=PRODUCTION)),
+            SQLiteReaderPlugin(str(path), PRODUCTION),
+        ],
+    )
+    async with AsyncTestClient(app=app) as client:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        await client.get(f"/study/{study_id}")
+        start = time.process_time()
+        for _ in range(ROUNDS // 4):
+            await client.get(f"/study/{study_id}")
+        return (time.process_time() - start) / (ROUNDS // 4) * 1e6
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.sqlite"
+        study_id, helpers = await measure_helpers(path)
+        request = await measure_request(path, study_id)
+    print(f"{'read_item_by_id':<20}{'CPU (us)':>12}")
+    for name, cpu in helpers.items():
+        print(f"{name:<20}{cpu:>12.1f}")
+    print(f"{'GET /study/{id}':<20}{request:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Write throughput of concurrent small POSTs with a transaction per request versus group commit.
+
+Run with ``python -m benchmarks.writes``.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from httpx import ASGITransport, AsyncClient
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+
+from src.helpers import PRODUCTION, GroupCommitPlugin, SQLiteReaderPlugin, create_db_config, provide_transaction
+from src.router import InvestigationController
+
+ROUNDS = 5
+CONCURRENCY = 200
+
+
+async def measure(path: Path, group_commit: bool) -> float:
+    plugins = [
+        SQLAlchemyPlugin(create_db_config(str(path), profile=PRODUCTION)),
+        SQLiteReaderPlugin(str(path), PRODUCTION),
+    ]
+    if group_commit:
+        plugins.append(GroupCommitPlugin())
+    app = Litestar([InvestigationController], dependencies={"transaction": provide_transaction}, plugins=plugins)
+    # The test client runs the lifespan but handles one request at a time, so requests go straight to the app
+    async with AsyncTestClient(app=app), AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        start = time.perf_counter()
+        for attempt in range(ROUNDS):
+            responses = await asyncio.gather(
+                *(
+                    client.post("/investigation", json={"title": f"{group_commit} {attempt} {index}"})
+                    for index in range(CONCURRENCY)
+                )
+            )
+            failed = [response.status_code for response in responses if response.status_code != 201]
+            if failed:
+                msg = f"{len(failed)} writes failed with {set(failed)}"
+                raise RuntimeError(msg)
+        return ROUNDS * CONCURRENCY / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.sqlite"
+        results = {name: await measure(path, group) for name, group in (("transaction", False), ("group", True))}
+    print(f"{'commit':<15}{'writes/s':>12}")
+    for name, result in results.items():
+        print(f"{name:<15}{result:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
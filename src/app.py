@@ -1,13 +1,16 @@
+import os
+
 from litestar import Litestar
 from litestar.config.cors import CORSConfig
 from litestar.contrib.sqlalchemy.plugins import SQLAlchemyPlugin
 from litestar.openapi import OpenAPIConfig
 
-from src.helpers import create_db_config, provide_transaction
+from src.helpers import GroupCommitPlugin, SQLiteReaderPlugin, create_db_config, get_sqlite_profile, provide_transaction
 from src.router import (
     BiologicalMaterialController,
     DataFileController,
     DeviceController,
+    DiagnosticsController,
     EnvironmentController,
     EventController,
     ExperimentalFactorController,
@@ -25,8 +28,17 @@ from src.router import (
     UnitController,
     VocabularyController,
 )
+from src.router.utils.cache import LRUStore
 
-db_config = create_db_config("db.sqlite")
+# One of development, production, bulk-import or read-only; statements are only logged in development, which
+# `litestar run --debug` selects through LITESTAR_DEBUG
+debug = os.getenv("LITESTAR_DEBUG") == "1"
+profile = get_sqlite_profile(os.getenv("MIAPPE_SQLITE_PROFILE", "development" if debug else "production"))
+db_config = create_db_config("db.sqlite", profile=profile)
+plugins = [SQLAlchemyPlugin(db_config), SQLiteReaderPlugin("db.sqlite", profile)]
+# Opt in to committing concurrent writes together, for bursts of small writes such as field devices syncing
+if os.getenv("MIAPPE_GROUP_COMMIT") == "1":
+    plugins.append(GroupCommitPlugin())
 cors_config = CORSConfig(allow_origins=["*"])
 app = Litestar(
     [
@@ -49,9 +61,11 @@ app = Litestar(
         StudyController,
         StaffController,
         SPARQLController,
+        DiagnosticsController,
     ],
     dependencies={"transaction": provide_transaction},
-    plugins=[SQLAlchemyPlugin(db_config)],
+    plugins=plugins,
     cors_config=cors_config,
+    stores={"response_cache": LRUStore()},
     openapi_config=OpenAPIConfig(title="miappe_schema", version="1.0.0"),
 )
@@ -1,37 +1,385 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import sqlite3
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, cast
+from uuid import UUID
 
+import aiosqlite
 from advanced_alchemy.extensions.litestar.plugins import EngineConfig
 from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import (
     autocommit_before_send_handler,
+    default_before_send_handler,
 )
+from litestar.config.app import AppConfig
 from litestar.contrib.sqlalchemy.plugins import SQLAlchemyAsyncConfig
-from litestar.exceptions import ClientException
+from litestar.di import Provide
+from litestar.enums import ScopeType
+from litestar.exceptions import ClientException, ImproperlyConfiguredException
+from litestar.plugins import InitPluginProtocol
 from litestar.status_codes import HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
-from sqlalchemy import Engine, event
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy import Engine, bindparam, event, select, text
 from sqlalchemy import log as sqlalchemy_log
-from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, NoResultFound, OperationalError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    AsyncTransaction,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import await_only
 
 from src.model.base import Base
+from src.model.version import (
+    ALL_ROWS,
+    STORED_ROW_VERSIONS,
+    STORED_VERSIONS,
+    Row,
+    bump_row_versions_stmt,
+    bump_stored_versions_stmt,
+    row_version_table,
+    table_version_table,
+    table_versions,
+    written_rows,
+    written_tables,
+)
 
 sqlalchemy_log._add_default_handler = lambda x: None  # type: ignore[assignment]
 
-__all__ = ("create_db_config", "provide_transaction", "set_sqlite_pragma")
+__all__ = (
+    "BULK_IMPORT",
+    "DEVELOPMENT",
+    "GROUP_COMMIT_SIZE",
+    "GROUP_COMMIT_WINDOW",
+    "PRODUCTION",
+    "READ_ONLY",
+    "SAFE_METHODS",
+    "SQLITE_PROFILES",
+    "WRITE_RETRIES",
+    "WRITE_RETRY_DELAY",
+    "GroupCommitPlugin",
+    "SQLiteProfile",
+    "SQLiteReaderPlugin",
+    "before_send_handler",
+    "begin_sqlite_transaction",
+    "create_db_config",
+    "create_sqlite_engine",
+    "database_errors",
+    "get_sqlite_profile",
+    "provide_transaction",
+    "read_pragmas",
+    "set_sqlite_pragma",
+)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+# Further attempts at starting a write transaction after the busy timeout ran out, with doubling delays
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.05
+# Seconds a group commit batch stays open for further write requests, and the most requests it takes
+GROUP_COMMIT_WINDOW = 0.005
+GROUP_COMMIT_SIZE = 100
+# Session info keys of the group commit batch a session joined, and of the callable that joins it
+BATCH = "group_commit_batch"
+JOIN_BATCH = "join_group_commit_batch"
+# Run on a plain aiosqlite connection, so built once as SQL text
+READ_TABLE_VERSIONS = str(select(table_version_table.c.name, table_version_table.c.version))
+READ_ROW_VERSIONS = str(
+    select(row_version_table.c.name, row_version_table.c.id, row_version_table.c.version).where(
+        row_version_table.c.id.in_([bindparam("id"), bindparam("all_rows")])
+    )
+)
 
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+    # The driver's own transaction handling commits when the outermost SAVEPOINT is released; SQLAlchemy emits BEGIN
+    # instead (see begin_sqlite_transaction) so that savepoints nest inside the session's transaction.
+    dbapi_connection.isolation_level = None
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
 
-async def provide_transaction(
-    db_session: AsyncSession,
-) -> AsyncGenerator[AsyncSession, None]:
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+TEMP_STORE = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Connection, pool and logging settings for one way of running the database.
+
+    ``synchronous``, ``cache_size``, ``mmap_size``, ``temp_store`` and ``query_only`` are set on every connection.
+    ``journal_mode`` is stored in the database file and set by the writer only.
+    """
+
+    name: str
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -2000
+    """Pages when positive, KiB when negative, as in ``PRAGMA cache_size``."""
+    mmap_size: int = 0
+    temp_store: str = "DEFAULT"
+    query_only: bool = False
+    busy_timeout: float = 5.0
+    """Seconds a connection waits on a locked database before reporting "database is locked"."""
+    reader_pool_size: int = 4
+    stream_pool_size: int = 2
+    """Read-only connections kept apart for streamed responses, each held until its client has read the whole body."""
+    write_queue_timeout: int = 30
+    """Seconds a write request waits in line for the single writer connection."""
+    echo: bool = False
+
+    def __post_init__(self) -> None:
+        if self.journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"journal_mode must be one of {', '.join(JOURNAL_MODES)}, not {self.journal_mode}")
+        if self.synchronous not in SYNCHRONOUS:
+            raise ValueError(f"synchronous must be one of {', '.join(SYNCHRONOUS)}, not {self.synchronous}")
+        if self.temp_store not in TEMP_STORE:
+            raise ValueError(f"temp_store must be one of {', '.join(TEMP_STORE)}, not {self.temp_store}")
+        if self.mmap_size < 0 or self.busy_timeout < 0 or self.write_queue_timeout < 0:
+            raise ValueError("mmap_size, busy_timeout and write_queue_timeout cannot be negative")
+        if self.reader_pool_size < 1 or self.stream_pool_size < 1:
+            raise ValueError("reader_pool_size and stream_pool_size must be at least 1")
+
+    def pragmas(self, writer: bool = True) -> dict[str, Any]:
+        """Pragma values to set on a new connection, as ``PRAGMA`` reads them back."""
+        pragmas: dict[str, Any] = {"journal_mode": self.journal_mode.lower()} if writer else {}
+        pragmas.update(
+            synchronous=SYNCHRONOUS[self.synchronous],
+            cache_size=self.cache_size,
+            mmap_size=self.mmap_size,
+            temp_store=TEMP_STORE[self.temp_store],
+            query_only=int(self.query_only),
+        )
+        return pragmas
+
+    def mismatches(self, pragmas: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+        """Settings that ``pragmas`` read from a reader connection do not match, as (expected, actual) pairs.
+
+        ``mmap_size`` is left out because SQLite silently caps it at a compile-time limit.
+        """
+        expected = self.pragmas(writer=False)
+        expected.update(journal_mode=self.journal_mode.lower(), busy_timeout=int(self.busy_timeout * 1000))
+        del expected["mmap_size"]
+        return {name: (value, pragmas[name]) for name, value in expected.items() if pragmas[name] != value}
+
+
+DEVELOPMENT = SQLiteProfile(name="development", echo=True)
+PRODUCTION = SQLiteProfile(
+    name="production", cache_size=-65536, mmap_size=268435456, temp_store="MEMORY", reader_pool_size=8
+)
+# Durability is traded for speed while loading data that can be loaded again
+BULK_IMPORT = SQLiteProfile(
+    name="bulk-import",
+    synchronous="OFF",
+    cache_size=-262144,
+    mmap_size=268435456,
+    temp_store="MEMORY",
+    busy_timeout=30.0,
+    reader_pool_size=2,
+    write_queue_timeout=300,
+)
+# Serves a database whose schema another process created; nothing can be written, so create_all is skipped
+READ_ONLY = SQLiteProfile(
+    name="read-only",
+    cache_size=-131072,
+    mmap_size=1073741824,
+    temp_store="MEMORY",
+    query_only=True,
+    reader_pool_size=16,
+)
+SQLITE_PROFILES = {profile.name: profile for profile in (DEVELOPMENT, PRODUCTION, BULK_IMPORT, READ_ONLY)}
+
+
+def get_sqlite_profile(name: str) -> SQLiteProfile:
+    if name not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{name}', expected one of {', '.join(SQLITE_PROFILES)}")
+    return SQLITE_PROFILES[name]
+
+
+def apply_profile(profile: SQLiteProfile, writer: bool, dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in profile.pragmas(writer).items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str, profile: SQLiteProfile, writer: bool = True, **kwargs: Any) -> AsyncEngine:
+    """Create an engine whose connections are set up by ``profile``."""
+    engine = create_async_engine(url, echo=profile.echo, **kwargs)
+    event.listen(engine.sync_engine, "connect", partial(apply_profile, profile, writer))
+    return engine
+
+
+async def read_pragmas(connection: AsyncConnection) -> dict[str, Any]:
+    """Read back the settings of ``connection`` that a :class:`SQLiteProfile` controls."""
+    names = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "query_only", "busy_timeout")
+    return {name: await connection.scalar(text(f"PRAGMA {name}")) for name in names}
+
+
+@event.listens_for(Engine, "begin")
+def begin_sqlite_transaction(conn):  # type: ignore[no-untyped-def]
+    """Start the transaction in the mode set by the ``sqlite_begin`` execution option, ``DEFERRED`` by default.
+
+    The writer begins ``IMMEDIATE`` so that the write lock is taken before any work is done, where a lock timeout can
+    still be retried safely, ``sqlite_begin_retries`` times.
+    """
+    options = conn.get_execution_options()
+    retries = options.get("sqlite_begin_retries", 0)
+    for attempt in range(retries + 1):
+        try:
+            conn.exec_driver_sql(f"BEGIN {options.get('sqlite_begin', 'DEFERRED')}")
+            return
+        except OperationalError as exc:
+            if attempt == retries or "locked" not in str(exc.orig):
+                raise
+            await_only(asyncio.sleep(WRITE_RETRY_DELAY * 2**attempt))
+
+
+class SQLiteReaderPlugin(InitPluginProtocol):
+    """A pool of read-only connections to the database file, next to the single writer of :func:`create_db_config`.
+
+    Provides ``db_reader``, the read-only engine, ``read_session`` and ``sqlite_profile``. In WAL mode these never
+    wait on the writer. On startup the settings of a reader connection are checked against ``profile``.
+
+    Streamed responses read through ``stream_reader``, a second read-only engine with a pool of its own. A stream holds
+    its connection for as long as the client takes to read the body, so slow consumers wait for each other there
+    rather than for the connections of ordinary reads.
+
+    Before a cached response is looked up, the table versions other processes stored in the database are read, so
+    that every worker on the file drops the responses a write in any of them made stale.
+    """
+
+    def __init__(self, sqlite_db: str, profile: SQLiteProfile = DEVELOPMENT) -> None:
+        self.sqlite_db = sqlite_db
+        self.profile = profile
+        self.engine = self.create_engine(profile.reader_pool_size)
+        self.stream_engine = self.create_engine(profile.stream_pool_size)
+        self.session_maker = async_sessionmaker(self.engine, autoflush=False, expire_on_commit=False)
+        self._versions_connection: aiosqlite.Connection | None = None
+
+    def create_engine(self, pool_size: int) -> AsyncEngine:
+        return create_sqlite_engine(
+            f"sqlite+aiosqlite:///file:{self.sqlite_db}?mode=ro&uri=true",
+            self.profile,
+            writer=False,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=0,
+            connect_args={"timeout": self.profile.busy_timeout},
+        )
+
+    async def provide_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Session for handlers that only read.
+
+        Nothing is flushed or expired, the deferred ``BEGIN`` keeps the reads of one request on one snapshot, and the
+        transaction is rolled back when the session closes.
+        """
+        async with self.session_maker() as session:
+            try:
+                yield session
+            except NoResultFound as exc:
+                raise ClientException(
+                    status_code=HTTP_404_NOT_FOUND, detail="No database result matching query"
+                ) from exc
+
+    async def open_versions_connection(self) -> None:
+        # Outside the pool and in autocommit, so that a check is a single statement and never waits for a connection
+        self._versions_connection = await aiosqlite.connect(
+            f"file:{self.sqlite_db}?mode=ro", uri=True, isolation_level=None, timeout=self.profile.busy_timeout
+        )
+
+    async def close_versions_connection(self) -> None:
+        if self._versions_connection is not None:
+            await self._versions_connection.close()
+            self._versions_connection = None
+
+    async def _read_versions(self, sql: str, parameters: dict[str, Any] | None = None) -> list[Any] | None:
+        # None when there is nothing to read from: before startup, or on a database created without the version
+        # tables, which the read-only profile does not create
+        if self._versions_connection is None:
+            return None
+        try:
+            return list(await self._versions_connection.execute_fetchall(sql, parameters or {}))
+        except sqlite3.OperationalError as exc:
+            if "no such table" not in str(exc):
+                raise
+            return None
+
+    async def read_table_versions(self) -> dict[str, int] | None:
+        """The versions stored in the database, which count the writes of every process on the file.
+
+        ``None`` when none are stored, and responses are then keyed by the versions of this process alone.
+        """
+        rows = await self._read_versions(READ_TABLE_VERSIONS)
+        return None if rows is None else dict(rows)
+
+    async def read_row_versions(self, item_id: UUID) -> dict[Row, int] | None:
+        """The stored versions of the item ``item_id`` in each table, and of the writes to unknown rows of each table.
+
+        ``None`` when none are stored, and items are then keyed by the versions of their tables instead.
+        """
+        rows = await self._read_versions(READ_ROW_VERSIONS, {"id": item_id.hex, "all_rows": ALL_ROWS.hex})
+        return None if rows is None else {(name, UUID(stored_id)): version for name, stored_id, version in rows}
+
+    def sync_table_versions(self, app: ASGIApp) -> ASGIApp:
+        async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] == ScopeType.HTTP and getattr(scope["route_handler"], "cache", False):
+                # A single item only needs the versions of its own rows
+                item_id = cast("UUID | None", scope["path_params"].get("id"))
+                if item_id is not None and (rows := await self.read_row_versions(item_id)) is not None:
+                    scope["state"][STORED_ROW_VERSIONS] = rows
+                elif (stored := await self.read_table_versions()) is not None:
+                    scope["state"][STORED_VERSIONS] = stored
+            await app(scope, receive, send)
+
+        return middleware
+
+    async def check_profile(self) -> None:
+        async with self.engine.connect() as connection:
+            mismatches = self.profile.mismatches(await read_pragmas(connection))
+        if mismatches:
+            detail = ", ".join(f"{name} is {actual}, not {expected}" for name, (expected, actual) in mismatches.items())
+            raise ImproperlyConfiguredException(f"SQLite profile '{self.profile.name}' did not apply: {detail}")
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        app_config.dependencies.update(
+            {
+                "db_reader": Provide(lambda: self.engine, sync_to_thread=False),
+                "stream_reader": Provide(lambda: self.stream_engine, sync_to_thread=False),
+                "read_session": Provide(self.provide_read_session),
+                "sqlite_profile": Provide(lambda: self.profile, sync_to_thread=False),
+            }
+        )
+        app_config.middleware.append(self.sync_table_versions)
+        # After the writer has created the database and set its journal mode, as plugins start up in order
+        app_config.on_startup.extend((self.check_profile, self.open_versions_connection))
+        app_config.on_shutdown.extend((self.close_versions_connection, self.engine.dispose, self.stream_engine.dispose))
+        return app_config
+
+
+async def before_send_handler(message: Message, scope: Scope) -> None:
+    """Close the session of safe requests without a commit, and commit or roll back the others by status."""
+    if scope.get("method") in SAFE_METHODS:
+        await default_before_send_handler(message, scope)
+    else:
+        await autocommit_before_send_handler(message, scope)
+
+
+@contextmanager
+def database_errors() -> Iterator[None]:
     try:
-        async with db_session.begin():
-            yield db_session
+        yield
     except IntegrityError as exc:
         raise ClientException(
             status_code=HTTP_409_CONFLICT,
@@ -41,11 +389,153 @@ async def provide_transaction(
         raise ClientException(status_code=HTTP_404_NOT_FOUND, detail="No database result matching query") from exc
 
 
-def create_db_config(sqlite_db: str) -> SQLAlchemyAsyncConfig:
+async def provide_transaction(
+    db_session: AsyncSession,
+) -> AsyncGenerator[AsyncSession, None]:
+    with database_errors():
+        async with db_session.begin():
+            yield db_session
+
+
+@dataclass
+class _Batch:
+    connection: AsyncConnection
+    transaction: AsyncTransaction
+    committed: asyncio.Future[None]
+    size: int = field(default=0)
+    tables: set[str] = field(default_factory=set)
+    """Tables written by the requests of the batch."""
+    rows: set[Row] = field(default_factory=set)
+    """Items changed by the requests of the batch."""
+    closer: asyncio.Task[None] | None = field(default=None)
+
+
+class _BatchSession(Session):
+    """Session that joins the open batch of a :class:`GroupCommitPlugin` when it first needs the database."""
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Any:
+        if BATCH not in self.info:
+            self.info[BATCH] = await_only(self.info[JOIN_BATCH]())
+        return self.info[BATCH].connection.sync_connection
+
+
+class GroupCommitPlugin(InitPluginProtocol):
+    """Run concurrent write requests in one transaction, so that one COMMIT and one fsync serve all of them.
+
+    Replaces the ``transaction`` dependency. Each request runs in a SAVEPOINT of its own on the writer connection: a
+    request that fails rolls back to its savepoint and gets its own error, without touching the others. The batch is
+    committed ``window`` seconds after it opened, or as soon as ``max_size`` requests joined it, and every request
+    waits for that commit before its response is sent.
+
+    Savepoints on one connection must not interleave, so a request has the connection to itself from its first
+    statement until its savepoint is released. Until then it runs alongside the others, and after it only waits for
+    the shared commit.
+    """
+
+    def __init__(self, window: float = GROUP_COMMIT_WINDOW, max_size: int = GROUP_COMMIT_SIZE) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._lock = asyncio.Lock()
+        self._batch: _Batch | None = None
+
+    async def _open(self, db_engine: AsyncEngine) -> _Batch:
+        connection = await db_engine.connect()
+        batch = _Batch(connection, await connection.begin(), asyncio.get_running_loop().create_future())
+        batch.closer = asyncio.create_task(self._commit_after_window(batch))
+        self._batch = batch
+        return batch
+
+    async def _join(self, db_engine: AsyncEngine) -> _Batch:
+        await self._lock.acquire()
+        try:
+            batch = self._batch or await self._open(db_engine)
+        except BaseException:
+            self._lock.release()
+            raise
+        batch.size += 1
+        return batch
+
+    async def _commit(self, batch: _Batch) -> None:
+        if self._batch is not batch:
+            return
+        self._batch = None
+        try:
+            if batch.tables:
+                await batch.connection.execute(bump_stored_versions_stmt(batch.tables))
+            if batch.rows:
+                await batch.connection.execute(bump_row_versions_stmt(batch.rows))
+            await batch.transaction.commit()
+        except SQLAlchemyError as exc:
+            batch.committed.set_exception(exc)
+        else:
+            # The requests only released their savepoints, so cached reads of their tables are invalidated now
+            table_versions.bump(batch.tables)
+            batch.committed.set_result(None)
+        finally:
+            await batch.connection.close()
+
+    async def _commit_after_window(self, batch: _Batch) -> None:
+        await asyncio.sleep(self.window)
+        async with self._lock:
+            await self._commit(batch)
+
+    async def provide_transaction(self, db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+        session = AsyncSession(
+            join_transaction_mode="create_savepoint", expire_on_commit=False, sync_session_class=_BatchSession
+        )
+        session.info[JOIN_BATCH] = partial(self._join, db_engine)
+        try:
+            with database_errors():
+                async with session.begin():
+                    yield session
+                    await session.flush()
+                    if BATCH in session.info:
+                        # The batch bumps the versions of every table and item its requests wrote once, when it commits
+                        session.info[BATCH].tables.update(written_tables(session.sync_session))
+                        session.info[BATCH].rows.update(written_rows(session.sync_session))
+                        written_tables(session.sync_session).clear()
+                        written_rows(session.sync_session).clear()
+        finally:
+            await session.close()
+            batch: _Batch | None = session.info.get(BATCH)
+            if batch is not None:
+                if batch.size >= self.max_size:
+                    await self._commit(batch)
+                self._lock.release()
+        if batch is not None:
+            await asyncio.shield(batch.committed)
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        app_config.dependencies["transaction"] = Provide(self.provide_transaction)
+        return app_config
+
+
+def create_db_config(
+    sqlite_db: str,
+    profile: SQLiteProfile = DEVELOPMENT,
+    write_retries: int = WRITE_RETRIES,
+) -> SQLAlchemyAsyncConfig:
+    """Configure the writer: one connection, for which write requests queue in the pool.
+
+    Only one SQLite connection can write at a time, so writes take turns in the process instead of contending for the
+    file lock. Reads go through :class:`SQLiteReaderPlugin`.
+
+    A ``query_only`` profile such as :data:`READ_ONLY` serves an existing database: the schema is not created.
+    """
+    # Under query_only even taking the write lock fails, so writes are left to fail on their first statement
+    begin = "DEFERRED" if profile.query_only else "IMMEDIATE"
     return SQLAlchemyAsyncConfig(
         connection_string=f"sqlite+aiosqlite:///{sqlite_db}",
         metadata=Base.metadata,
-        create_all=True,
-        before_send_handler=autocommit_before_send_handler,
-        engine_config=EngineConfig(echo=True),
+        create_all=not profile.query_only,
+        before_send_handler=before_send_handler,
+        create_engine_callable=partial(create_sqlite_engine, profile=profile),
+        engine_config=EngineConfig(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=profile.write_queue_timeout,
+            connect_args={"timeout": profile.busy_timeout},
+            execution_options={"sqlite_begin": begin, "sqlite_begin_retries": write_retries},
+        ),
     )
@@ -7,6 +7,7 @@ from src.model.event import Event
 from src.model.experiment import Experiment
 from src.model.experimental_factor import ExperimentalFactor
 from src.model.facility import Facility
+from src.model.index import index_foreign_keys
 from src.model.institution import Institution
 from src.model.investigation import Investigation
 from src.model.method import Method
@@ -17,8 +18,11 @@ from src.model.staff import Staff
 from src.model.study import Study
 from src.model.unit import Unit
 from src.model.variable import Variable
+from src.model.version import table_version_table
 from src.model.vocabulary import Vocabulary
 
+index_foreign_keys(Base.metadata)
+
 __all__ = [
     "Base",
     "Device",
@@ -40,4 +44,5 @@ __all__ = [
     "Institution",
     "DataFile",
     "Experiment",
+    "table_version_table",
 ]
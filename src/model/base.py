@@ -1,4 +1,3 @@
-import abc
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -7,7 +6,8 @@ from uuid import UUID, uuid4
 from advanced_alchemy.base import CommonTableAttributes
 from advanced_alchemy.types import DateTimeUTC
 from litestar.dto import dto_field
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import Index
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, has_inherited_table, mapped_column
 
 __all__ = ("Base", "BaseDataclass")
 
@@ -32,6 +32,14 @@ class Base(CommonTableAttributes, DeclarativeBase):
         info=dto_field("read-only"),
     )
 
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> tuple[Any, ...]:
+        # Keyset pagination orders on (created_at, id). Joined-inheritance subtables share the parent's key.
+        if has_inherited_table(cls):
+            return ()
+        return (Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),)
+
     def to_dict(self, exclude: set[str] | None = None) -> dict[str, Any]:
         data_dict = super().to_dict(exclude)
         data_dict["updated_at"] = datetime.now(UTC)
@@ -49,9 +57,3 @@ class BaseDataclass:
         if exclude:
             return {k: v for k, v in result.items() if k not in exclude}
         return result
-
-    @classmethod
-    @abc.abstractmethod
-    def from_orm(cls, data: Serialisable) -> "BaseDataclass":
-        data_dict = data.to_dict()
-        return cls(**data_dict)
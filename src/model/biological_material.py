@@ -33,7 +33,7 @@ class BiologicalMaterial(Variable):
         ),
     )
     organism: Mapped["Vocabulary"] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="organism",
     )
@@ -55,7 +55,7 @@ class BiologicalMaterial(Variable):
     material_source_description: Mapped[str | None]
 
     observation_units: Mapped[list["ObservationUnit"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="biological_material",
     )
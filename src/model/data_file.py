@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -7,7 +7,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 __all__ = ("DataFile", "DataFileDataclass")
 
@@ -34,7 +34,7 @@ class DataFile(Base):
     # Relationship
     studies: Mapped[list["Study"]] = relationship(
         secondary="study_data_file_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="data_files",
     )
@@ -46,11 +46,3 @@ class DataFileDataclass(BaseDataclass):
     data_file_version: str
     data_file_link: str
     study_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "DataFileDataclass":
-        data = cast(DataFile, data)
-        data_dict = data.to_dict()
-        if len(data.studies) > 0:
-            data_dict["study_id"] = [item.id for item in data.studies]
-        return cls(**data_dict)
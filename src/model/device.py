@@ -32,7 +32,7 @@ class Device(Base):
         ),
     )
     device_type: Mapped[Optional["Vocabulary"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="device",
     )
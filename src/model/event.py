@@ -1,6 +1,6 @@
 import datetime
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -8,7 +8,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 if TYPE_CHECKING:
     from src.model.observation_unit import ObservationUnit
@@ -49,19 +49,19 @@ class Event(Base):
 
     # Relationship
     event_type: Mapped[Optional["Vocabulary"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="event",
     )
     observation_units: Mapped[list["ObservationUnit"]] = relationship(
         secondary="event_to_ob_unit_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="events",
     )
     studies: Mapped[list["Study"]] = relationship(
         secondary="event_to_study_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="events",
     )
@@ -75,13 +75,3 @@ class EventDataclass(BaseDataclass):
     event_type_id: UUID | None = field(default=None)
     observation_unit_id: list[UUID] = field(default_factory=list[UUID])
     study_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "BaseDataclass":
-        data = cast(Event, data)
-        data_dict = data.to_dict()
-        if len(data.observation_units) > 0:
-            data_dict["observation_unit_id"] = [item.id for item in data.observation_units]
-        if len(data.studies) > 0:
-            data_dict["study_id"] = [item.id for item in data.studies]
-        return cls(**data_dict)
@@ -1,6 +1,6 @@
 import datetime
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -8,7 +8,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 __all__ = ("Experiment",)
 
@@ -48,13 +48,13 @@ class Experiment(Base):
     # Relationship
     facilities: Mapped[list["Facility"]] = relationship(
         secondary="experiment_to_facility_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="experiments",
     )
     staffs: Mapped[list["Staff"]] = relationship(
         secondary="experiment_to_staff_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="experiments",
     )
@@ -64,7 +64,7 @@ class Experiment(Base):
     )
     experiment_type: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="experiment",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -76,7 +76,7 @@ class Experiment(Base):
     )
     study: Mapped[Optional["Study"]] = relationship(
         back_populates="experiments",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -96,13 +96,3 @@ class ExperimentDataclass(BaseDataclass):
     study_id: UUID | None = field(default=None)
     facility_id: list[UUID] = field(default_factory=list[UUID])
     staff_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "ExperimentDataclass":
-        data = cast(Experiment, data)
-        data_dict = data.to_dict()
-        if len(data.facilities) > 0:
-            data_dict["facility_id"] = [item.id for item in data.facilities]
-        if len(data.staffs) > 0:
-            data_dict["staff_id"] = [item.id for item in data.staffs]
-        return cls(**data_dict)
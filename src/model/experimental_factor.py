@@ -35,14 +35,14 @@ class ExperimentalFactor(Variable):
     )
     factor_type: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="factor_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("private"),
     )
 
     observation_units: Mapped[list["ObservationUnit"]] = relationship(
         secondary="ob_unit_to_exp_factor_table",
         back_populates="experimental_factors",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
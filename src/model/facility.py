@@ -34,24 +34,24 @@ class Facility(Base):
     institution_id: Mapped[UUID | None] = mapped_column(ForeignKey("institution_table.id", ondelete="SET NULL"))
     institution: Mapped[Optional["Institution"]] = relationship(
         back_populates="facilities",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     facility_type_id: Mapped[UUID | None] = mapped_column(ForeignKey("vocabulary_table.id", ondelete="SET NULL"))
     facility_type: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="facility",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     experiments: Mapped[list["Experiment"]] = relationship(
         secondary="experiment_to_facility_table",
         back_populates="facilities",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     observation_units: Mapped[list["ObservationUnit"]] = relationship(
         back_populates="facility",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
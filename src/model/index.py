@@ -0,0 +1,48 @@
+from typing import Any
+
+from sqlalchemy import Column, Index, MetaData, Table
+from sqlalchemy.orm import registry
+
+__all__ = ("index_foreign_keys", "is_association_table", "is_indexed", "unindexed_relationship_columns")
+
+
+def is_indexed(column: Column[Any]) -> bool:
+    """Whether ``column`` can be looked up through an index, i.e. it leads the primary key or some index."""
+    if column.index or column.unique:
+        return True
+    primary_key = list(column.table.primary_key.columns)
+    if primary_key and primary_key[0] is column:
+        return True
+    return any(next(iter(index.columns)) is column for index in column.table.indexes)
+
+
+def is_association_table(table: Table) -> bool:
+    return len(table.primary_key.columns) > 1 and all(
+        column.primary_key and column.foreign_keys for column in table.columns
+    )
+
+
+def index_foreign_keys(metadata: MetaData, *, without_rowid: bool = False) -> None:
+    """Index every foreign key column that does not already lead an index.
+
+    For association tables this adds the reverse-side index, since the composite primary key only serves lookups by
+    its first column. With ``without_rowid`` association tables are stored clustered on their primary key, which
+    saves the rowid b-tree but only applies to newly created tables, so it is off unless a schema is built for it.
+    """
+    for table in metadata.tables.values():
+        for column in table.columns:
+            if column.foreign_keys and not is_indexed(column):
+                Index(f"ix_{table.name}_{column.name}", column)
+        if without_rowid and is_association_table(table):
+            table.dialect_options["sqlite"]["with_rowid"] = False
+
+
+def unindexed_relationship_columns(mapper_registry: registry) -> list[str]:
+    """List every column a relationship join filters on that no index can serve."""
+    missing = set()
+    for mapper in mapper_registry.mappers:
+        for prop in mapper.relationships:
+            for column in prop.remote_side:
+                if isinstance(column, Column) and not is_indexed(column):
+                    missing.add(f"{column.table.name}.{column.name}")
+    return sorted(missing)
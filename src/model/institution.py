@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -7,7 +7,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 __all__ = ("Institution",)
 
@@ -34,25 +34,25 @@ class Institution(Base):
     institution_type_id: Mapped[UUID | None] = mapped_column(ForeignKey("vocabulary_table.id", ondelete="SET NULL"))
     institution_type: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="institution",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     staffs: Mapped[list["Staff"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         secondary="institution_staff_table",
         info=dto_field("read-only"),
         back_populates="institutions",
     )
     facilities: Mapped[list["Facility"]] = relationship(
         back_populates="institution",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     children: Mapped[list["Institution"]] = relationship(
         secondary="institution_to_institution_table",
         back_populates="parents",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         primaryjoin="Institution.id == institution_to_institution_table.c.parent_id",
         secondaryjoin="Institution.id == institution_to_institution_table.c.child_id",
@@ -62,7 +62,7 @@ class Institution(Base):
     parents: Mapped[list["Institution"]] = relationship(
         secondary="institution_to_institution_table",
         back_populates="children",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         primaryjoin="Institution.id == institution_to_institution_table.c.child_id",
         secondaryjoin="Institution.id == institution_to_institution_table.c.parent_id",
@@ -76,11 +76,3 @@ class InstitutionDataclass(BaseDataclass):
     country: str | None = field(default=None)
     institution_type_id: UUID | None = field(default=None)
     parent_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "InstitutionDataclass":
-        data = cast(Institution, data)
-        data_dict = data.to_dict()
-        if len(data.parents) > 0:
-            data_dict["parent_id"] = [item.id for item in data.parents]
-        return cls(**data_dict)
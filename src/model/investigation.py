@@ -28,7 +28,7 @@ class Investigation(Base):
     studies: Mapped[list["Study"]] = relationship(
         "Study",
         back_populates="investigation",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         cascade="all, delete",
     )
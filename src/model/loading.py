@@ -0,0 +1,16 @@
+from sqlalchemy.orm import registry
+
+__all__ = ("implicitly_loaded_relationships",)
+
+
+def implicitly_loaded_relationships(mapper_registry: registry) -> list[str]:
+    """List every relationship that can emit SQL when an unloaded attribute is touched.
+
+    Related rows are read by the queries each controller plans, so every relationship should be ``raise_on_sql``.
+    """
+    return sorted(
+        f"{mapper.class_.__name__}.{prop.key}"
+        for mapper in mapper_registry.mappers
+        for prop in mapper.relationships
+        if prop.lazy != "raise_on_sql"
+    )
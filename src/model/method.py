@@ -25,12 +25,12 @@ class Method(Base):
     method_reference_id: Mapped[UUID | None] = mapped_column(ForeignKey("vocabulary_table.id", ondelete="SET NULL"))
     method_reference: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="method",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     device_id: Mapped[UUID | None] = mapped_column(ForeignKey("device_table.id", ondelete="SET NULL"))
-    device: Mapped[Optional["Device"]] = relationship(lazy=None, info=dto_field("read-only"))
+    device: Mapped[Optional["Device"]] = relationship(lazy="raise_on_sql", info=dto_field("read-only"))
     observed_variable: Mapped[Optional["ObservedVariable"]] = relationship(
-        lazy=None, info=dto_field("read-only"), back_populates="method"
+        lazy="raise_on_sql", info=dto_field("read-only"), back_populates="method"
     )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -7,7 +7,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 if TYPE_CHECKING:
     from src.model.biological_material import BiologicalMaterial
@@ -59,7 +59,7 @@ class ObservationUnit(Base):
     # Relationship
     studies: Mapped[list["Study"]] = relationship(
         secondary="ob_unit_to_study_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="observation_unit",
     )
@@ -67,7 +67,7 @@ class ObservationUnit(Base):
     facility_id: Mapped[UUID | None] = mapped_column(ForeignKey("facility_table.id", ondelete="SET NULL"))
     facility: Mapped[Optional["Facility"]] = relationship(
         back_populates="observation_units",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -76,7 +76,7 @@ class ObservationUnit(Base):
     )
     observation_unit_type: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="observation_unit",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -85,33 +85,33 @@ class ObservationUnit(Base):
     )
     biological_material: Mapped[Optional["BiologicalMaterial"]] = relationship(
         back_populates="observation_units",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     experimental_factors: Mapped[list["ExperimentalFactor"]] = relationship(
         secondary="ob_unit_to_exp_factor_table",
         back_populates="observation_units",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     events: Mapped[list["Event"]] = relationship(
         secondary="event_to_ob_unit_table",
         back_populates="observation_units",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     samples: Mapped[list["Sample"]] = relationship(
         back_populates="observation_unit",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
     parents: Mapped[list["ObservationUnit"]] = relationship(
         secondary="ob_unit_to_ob_unit_table",
         back_populates="children",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         primaryjoin="ObservationUnit.id == ob_unit_to_ob_unit_table.c.child_id",
         secondaryjoin="ObservationUnit.id == ob_unit_to_ob_unit_table.c.parent_id",
@@ -120,7 +120,7 @@ class ObservationUnit(Base):
     children: Mapped[list["ObservationUnit"]] = relationship(
         secondary="ob_unit_to_ob_unit_table",
         back_populates="parents",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         secondaryjoin="ObservationUnit.id == ob_unit_to_ob_unit_table.c.child_id",
         primaryjoin="ObservationUnit.id == ob_unit_to_ob_unit_table.c.parent_id",
@@ -137,15 +137,3 @@ class ObservationUnitDataclass(BaseDataclass):
     experimental_factor_id: list[UUID] = field(default_factory=list[UUID])
     study_id: list[UUID] = field(default_factory=list[UUID])
     parent_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "ObservationUnitDataclass":
-        data = cast(ObservationUnit, data)
-        data_dict = data.to_dict()
-        if len(data.experimental_factors) > 0:
-            data_dict["experimental_factor_id"] = [item.id for item in data.experimental_factors]
-        if len(data.parents) > 0:
-            data_dict["parent_id"] = [item.id for item in data.parents]
-        if len(data.studies) > 0:
-            data_dict["study_id"] = [item.id for item in data.studies]
-        return cls(**data_dict)
@@ -26,13 +26,13 @@ class ObservedVariable(Variable):
     title: Mapped[str] = mapped_column(nullable=False)
     method_id: Mapped[UUID | None] = mapped_column(ForeignKey("method_table.id", ondelete="SET NULL"))
     method: Mapped[Optional["Method"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         back_populates="observed_variable",
         info=dto_field("read-only"),
     )
     trait_reference_id: Mapped[UUID | None] = mapped_column(ForeignKey("vocabulary_table.id", ondelete="SET NULL"))
     trait_reference: Mapped[Optional["Vocabulary"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         back_populates="trait_reference",
         info=dto_field("read-only"),
         foreign_keys=[trait_reference_id],
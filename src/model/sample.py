@@ -33,18 +33,18 @@ class Sample(Base):
     # Relationship
     observation_unit: Mapped[Optional["ObservationUnit"]] = relationship(
         back_populates="samples",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     plant_structural_development_stage: Mapped[Optional["Vocabulary"]] = relationship(
         foreign_keys=[plant_structural_development_stage_id],
         back_populates="sample_plant_structural_development_stage",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     plant_anatomical_entity: Mapped[Optional["Vocabulary"]] = relationship(
         foreign_keys=[plant_anatomical_entity_id],
         back_populates="sample_plant_anatomical_entity",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
@@ -35,13 +35,13 @@ class Staff(Base):
     institutions: Mapped[list["Institution"]] = relationship(
         secondary="institution_staff_table",
         back_populates="staffs",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     experiments: Mapped[list["Experiment"]] = relationship(
         secondary="experiment_to_staff_table",
         back_populates="staffs",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -54,10 +54,3 @@ class StaffDataclass(BaseDataclass):
     orcid: str | None = field(default=None)
     role: str | None = field(default=None)
     institution_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Staff) -> "StaffDataclass":  # type: ignore[override]
-        data_dict = data.to_dict()
-        if len(data.institutions) > 0:
-            data_dict["institution_id"] = [item.id for item in data.institutions]
-        return cls(**data_dict)
@@ -29,36 +29,36 @@ class Study(Base):
     # Relationship
     investigation_id: Mapped[UUID] = mapped_column(ForeignKey("investigation_table.id", ondelete="cascade"))
     investigation: Mapped[Optional["Investigation"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="studies",
     )
     variables: Mapped[list["Variable"]] = relationship(
         secondary="study_variable_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="studies",
     )
     data_files: Mapped[list["DataFile"]] = relationship(
         secondary="study_data_file_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="studies",
     )
     experiments: Mapped[list["Experiment"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="study",
     )
     observation_unit: Mapped[list["ObservationUnit"]] = relationship(
         secondary="ob_unit_to_study_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="studies",
     )
     events: Mapped[list["Event"]] = relationship(
         secondary="event_to_study_table",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
         back_populates="studies",
     )
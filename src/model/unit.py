@@ -23,6 +23,6 @@ class Unit(Base):
     unit_reference_id: Mapped[UUID | None] = mapped_column(ForeignKey("vocabulary_table.id", ondelete="SET NULL"))
     unit_reference: Mapped[Optional["Vocabulary"]] = relationship(
         back_populates="unit",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from litestar.dto import dto_field
@@ -7,7 +7,7 @@ from sqlalchemy import UUID as UUID_SQL
 from sqlalchemy import Column, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.model.base import Base, BaseDataclass, Serialisable
+from src.model.base import Base, BaseDataclass
 
 __all__ = ("Variable",)
 
@@ -37,12 +37,12 @@ class Variable(Base):
     sample_interval: Mapped[str | None]
     device_id: Mapped[UUID | None] = mapped_column(ForeignKey("device_table.id", ondelete="SET NULL"))
     device: Mapped[Optional["Device"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     unit_id: Mapped[UUID | None] = mapped_column(ForeignKey("unit_table.id", ondelete="SET NULL"))
     unit: Mapped[Optional["Unit"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -50,7 +50,7 @@ class Variable(Base):
     studies: Mapped[list["Study"]] = relationship(
         secondary="study_variable_table",
         back_populates="variables",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
 
@@ -64,11 +64,3 @@ class VariableDataclass(BaseDataclass):
     device_id: UUID | None = field(default=None)
     unit_id: UUID | None = field(default=None)
     study_id: list[UUID] = field(default_factory=list[UUID])
-
-    @classmethod
-    def from_orm(cls, data: Serialisable) -> "VariableDataclass":
-        data = cast(Variable, data)
-        data_dict = data.to_dict()
-        if len(data.studies) > 0:
-            data_dict["study_id"] = [item.id for item in data.studies]
-        return cls(**data_dict)
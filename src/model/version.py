@@ -0,0 +1,280 @@
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    BinaryExpression,
+    BindParameter,
+    BooleanClauseList,
+    Column,
+    ColumnElement,
+    Insert,
+    Integer,
+    String,
+    Table,
+    TableClause,
+    Tuple,
+    Uuid,
+    event,
+    inspect,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql import operators
+
+from src.model.base import Base
+
+__all__ = (
+    "ALL_ROWS",
+    "STORED_ROW_VERSIONS",
+    "STORED_VERSIONS",
+    "Row",
+    "TableVersions",
+    "affected_tables",
+    "bump_row_versions_stmt",
+    "bump_stored_versions_stmt",
+    "row_version_table",
+    "table_version_table",
+    "table_versions",
+    "written_rows",
+    "written_tables",
+)
+
+WRITTEN_TABLES = "written_tables"
+WRITTEN_ROWS = "written_rows"
+# Request state key of the versions read from the database at the start of the request
+STORED_VERSIONS = "stored_versions"
+# Request state key of the row versions of the item a request reads, keyed by (table, id)
+STORED_ROW_VERSIONS = "stored_row_versions"
+# Stands for every row of a table, for writes whose rows are not known
+ALL_ROWS = UUID(int=0)
+
+Row = tuple[str, UUID]
+
+# Shared by every process on the database file: a counter per table, bumped in the transaction that writes the table
+table_version_table = Table(
+    "table_version",
+    Base.metadata,
+    Column("name", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+    sqlite_with_rowid=False,
+)
+
+# A counter per item, bumped in the transaction that changes it, so that a cached item is only dropped when it changed.
+# Rows are kept once written: a deleted item's counter must not start again from zero.
+row_version_table = Table(
+    "row_version",
+    Base.metadata,
+    Column("name", String, primary_key=True),
+    Column("id", Uuid, primary_key=True),
+    Column("version", Integer, nullable=False),
+    sqlite_with_rowid=False,
+)
+
+
+class TableVersions:
+    """A counter per table, bumped after every committed write to it.
+
+    Cached responses are keyed by the versions of the tables they were read from, so a write makes every entry that
+    depends on the table unreachable, and the LRU store drops them in time.
+    """
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {}
+
+    def bump(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self.versions[table] = self.versions.get(table, 0) + 1
+
+    def snapshot(self, tables: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self.versions.get(table, 0) for table in tables)
+
+
+table_versions = TableVersions()
+
+
+@cache
+def _referencing_tables(table: str) -> frozenset[str]:
+    """``table`` and every table whose rows a delete from it changes through ``ON DELETE`` actions, transitively."""
+    found = {table}
+    pending = [table]
+    while pending:
+        target = Base.metadata.tables[pending.pop()]
+        for other in Base.metadata.tables.values():
+            for key in other.foreign_keys:
+                if key.column.table is target and key.ondelete and other.name not in found:
+                    found.add(other.name)
+                    pending.append(other.name)
+    return frozenset(found)
+
+
+def affected_tables(tables: Iterable[str], deleted: bool) -> set[str]:
+    """The tables a write to ``tables`` changes, following foreign key actions for deletes."""
+    if not deleted:
+        return set(tables)
+    return {name for table in tables for name in _referencing_tables(table)}
+
+
+def bump_stored_versions_stmt(tables: Iterable[str]) -> Insert:
+    """Increment the stored version of each of ``tables``, starting those not stored yet at 1."""
+    stmt = insert(table_version_table).values([{"name": table, "version": 1} for table in sorted(tables)])
+    return stmt.on_conflict_do_update(index_elements=["name"], set_={"version": table_version_table.c.version + 1})
+
+
+def bump_row_versions_stmt(rows: Iterable[Row]) -> Insert:
+    """Increment the stored version of each of ``rows``, starting those not stored yet at 1."""
+    stmt = insert(row_version_table).values(
+        [{"name": name, "id": item_id, "version": 1} for name, item_id in sorted(rows)]
+    )
+    return stmt.on_conflict_do_update(index_elements=["name", "id"], set_={"version": row_version_table.c.version + 1})
+
+
+def written_tables(session: Session) -> set[str]:
+    """Names of the tables written in the current transaction of ``session``."""
+    return session.info.setdefault(WRITTEN_TABLES, set())  # type: ignore[no-any-return]
+
+
+def written_rows(session: Session) -> set[Row]:
+    """Items changed in the current transaction of ``session``, as (table, id), with ``ALL_ROWS`` for unknown rows."""
+    return session.info.setdefault(WRITTEN_ROWS, set())  # type: ignore[no-any-return]
+
+
+def _is_association(table: TableClause) -> bool:
+    return "id" not in table.c
+
+
+def _ends(table: TableClause, values: Mapping[str, Any]) -> set[Row]:
+    """The items at the ends of association rows, given the values each column is restricted to."""
+    return {
+        (key.column.table.name, item_id)
+        for column in table.c
+        for key in column.foreign_keys
+        for item_id in values.get(column.key, [ALL_ROWS])
+    }
+
+
+def _bound_values(value: Any, parameters: Mapping[str, Any]) -> list[Any] | None:
+    if not isinstance(value, BindParameter):
+        return None
+    if value.callable is not None:
+        bound = value.callable()
+    else:
+        bound = parameters.get(value.key) if value.value is None else value.value
+    return list(bound) if value.expanding else [bound]
+
+
+def _criteria_values(clause: ColumnElement[Any], parameters: Mapping[str, Any]) -> dict[str, list[Any]]:
+    """The values the ``=`` and ``IN`` terms of a conjunction restrict columns to, by column key."""
+    if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        values: dict[str, list[Any]] = {}
+        for term in clause.clauses:
+            values.update(_criteria_values(term, parameters))
+        return values
+    if not isinstance(clause, BinaryExpression) or clause.operator not in (operators.eq, operators.in_op):
+        return {}
+    if (bound := _bound_values(clause.right, parameters)) is None:
+        return {}
+    if isinstance(clause.left, Tuple):
+        keys = [column.key for column in clause.left.clauses]
+        return {key: [value[index] for value in bound] for index, key in enumerate(keys) if key is not None}
+    if isinstance(clause.left, Column):
+        return {clause.left.key: bound}
+    return {}
+
+
+def _statement_rows(state: ORMExecuteState, table: TableClause) -> set[Row]:
+    """The items an INSERT, UPDATE or DELETE of ``table`` changes, read from its parameters and WHERE clause.
+
+    New items cannot have been cached, so of the inserts only those into association tables change any. Rows that
+    cannot be told from the statement are recorded as ``ALL_ROWS`` of their table.
+    """
+    executed = state.parameters or {}
+    parameters: list[Mapping[str, Any]] = executed if isinstance(executed, list) else [executed]  # type: ignore[list-item]
+    if state.is_insert:
+        if not _is_association(table):
+            return set()
+        return {row for values in parameters for row in _ends(table, {key: [value] for key, value in values.items()})}
+    if "id" in parameters[0]:
+        return {(table.name, values["id"]) for values in parameters}
+    where = state.statement.whereclause  # type: ignore[attr-defined]
+    criteria = {} if where is None else _criteria_values(where, parameters[0])
+    if _is_association(table):
+        return _ends(table, criteria)
+    return {(table.name, item_id) for item_id in criteria.get("id", [ALL_ROWS])}
+
+
+def _cascaded_rows(table: str) -> set[Row]:
+    """Items that a delete from ``table`` may change through ``ON DELETE`` actions on other tables.
+
+    The links of a deleted item go with it, which changes the items at their other ends. Those are not known, so
+    every item of the tables at the other ends is recorded.
+    """
+    rows = set()
+    for name in _referencing_tables(table) - {table}:
+        other = Base.metadata.tables[name]
+        if not _is_association(other):
+            rows.add((name, ALL_ROWS))
+            continue
+        cascading = [column for column in other.c if any(key.column.table.name == table for key in column.foreign_keys)]
+        for column in other.c:
+            if cascading != [column]:
+                rows.update((key.column.table.name, ALL_ROWS) for key in column.foreign_keys)
+    return rows
+
+
+@event.listens_for(Session, "do_orm_execute")
+def record_statement_writes(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    tables = list(mapper.tables) if mapper is not None else [state.statement.table]  # type: ignore[attr-defined]
+    written_tables(state.session).update(affected_tables([table.name for table in tables], state.is_delete))
+    for table in tables:
+        written_rows(state.session).update(_statement_rows(state, table))
+        if state.is_delete:
+            written_rows(state.session).update(_cascaded_rows(table.name))
+
+
+@event.listens_for(Session, "after_flush")
+def record_flush_writes(session: Session, flush_context: UOWTransaction) -> None:
+    for instances, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        tables = {table.name for instance in instances for table in inspect(instance).mapper.tables}
+        written_tables(session).update(affected_tables(tables, deleted))
+    # As for statements, new items cannot have been cached, but both ends of a changed many-to-many link can
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        state = inspect(instance)
+        if instance not in session.new:
+            written_rows(session).update((table.name, instance.id) for table in state.mapper.tables)
+        if instance in session.deleted:
+            written_rows(session).update(row for table in state.mapper.tables for row in _cascaded_rows(table.name))
+        for prop in state.mapper.relationships:
+            if prop.secondary is not None:
+                history = state.attrs[prop.key].history
+                others = [*(history.added or ()), *(history.deleted or ())]
+                written_rows(session).update((table.name, other.id) for other in others for table in prop.mapper.tables)
+
+
+@event.listens_for(Session, "before_commit")
+def bump_stored_versions(session: Session) -> None:
+    """Bump the stored versions of the written tables and rows as part of the transaction being committed.
+
+    The final flush of a commit only runs after this hook, so it is done here first.
+    """
+    session.flush()
+    if tables := written_tables(session):
+        session.connection().execute(bump_stored_versions_stmt(tables))
+    if rows := written_rows(session):
+        session.connection().execute(bump_row_versions_stmt(rows))
+
+
+@event.listens_for(Session, "after_commit")
+def bump_written_tables(session: Session) -> None:
+    table_versions.bump(session.info.pop(WRITTEN_TABLES, ()))
+    session.info.pop(WRITTEN_ROWS, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_written_tables(session: Session) -> None:
+    session.info.pop(WRITTEN_TABLES, None)
+    session.info.pop(WRITTEN_ROWS, None)
@@ -37,69 +37,69 @@ class Vocabulary(Base):
     # # Relationships
     device: Mapped[list["Device"]] = relationship(
         back_populates="device_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     method: Mapped[list["Method"]] = relationship(
         back_populates="method_reference",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     unit: Mapped[list["Unit"]] = relationship(
         back_populates="unit_reference",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     factor_type: Mapped[list["ExperimentalFactor"]] = relationship(
         back_populates="factor_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     event: Mapped[list["Event"]] = relationship(
         back_populates="event_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     sample_plant_structural_development_stage: Mapped[list["Sample"]] = relationship(
         back_populates="plant_structural_development_stage",
-        lazy=None,
+        lazy="raise_on_sql",
         foreign_keys="[Sample.plant_structural_development_stage_id]",
         info=dto_field("read-only"),
     )
     sample_plant_anatomical_entity: Mapped[list["Sample"]] = relationship(
         back_populates="plant_anatomical_entity",
         foreign_keys="[Sample.plant_anatomical_entity_id]",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     facility: Mapped[list["Facility"]] = relationship(
         back_populates="facility_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     institution: Mapped[list["Institution"]] = relationship(
         back_populates="institution_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     experiment: Mapped[list["Experiment"]] = relationship(
         back_populates="experiment_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     organism: Mapped[list["BiologicalMaterial"]] = relationship(
         back_populates="organism",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
     trait_reference: Mapped[list["ObservedVariable"]] = relationship(
-        lazy=None,
+        lazy="raise_on_sql",
         back_populates="trait_reference",
         info=dto_field("read-only"),
         foreign_keys="[ObservedVariable.trait_reference_id]",
     )
     observation_unit: Mapped[list["ObservationUnit"]] = relationship(
         back_populates="observation_unit_type",
-        lazy=None,
+        lazy="raise_on_sql",
         info=dto_field("read-only"),
     )
@@ -2,6 +2,7 @@ from src.router.base import BaseController, GenericController
 from src.router.biological_material import BiologicalMaterialController
 from src.router.data_file import DataFileController
 from src.router.device import DeviceController
+from src.router.diagnostics import DiagnosticsController
 from src.router.environment import EnvironmentController
 from src.router.event import EventController
 from src.router.experiment import ExperimentController
@@ -21,6 +22,7 @@ from src.router.vocabulary import VocabularyController
 
 __all__ = [
     "DeviceController",
+    "DiagnosticsController",
     "VocabularyController",
     "MethodController",
     "UnitController",
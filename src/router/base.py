@@ -1,85 +1,323 @@
-from collections.abc import Sequence
-from typing import Any, Generic, TypeVar, cast
-from uuid import UUID
-
-from litestar import Controller, Router, delete, get, post, put
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from functools import partial
+from typing import Annotated, Any, Generic, TypeVar, get_type_hints
+from uuid import UUID, uuid4
+
+import msgspec
+from litestar import Controller, Request, Router, delete, get, patch, post, put
+from litestar.config.response_cache import CACHE_FOREVER
 from litestar.di import Provide
+from litestar.dto.field import DTO_FIELD_META_KEY, Mark
+from litestar.exceptions import ClientException, NotFoundException
+from litestar.handlers import BaseRouteHandler, HTTPRouteHandler
+from litestar.params import Parameter
+from litestar.response import Stream
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+from sqlalchemy import ColumnElement, Delete, Select, TableClause, bindparam, insert, inspect, select, update
 from sqlalchemy import delete as remove
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase, selectinload
-
-from src.model.base import Base, BaseDataclass, Serialisable
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.model.base import Base, BaseDataclass
+from src.router.utils.association import (
+    AssociationDelta,
+    add_association,
+    add_associations,
+    compile_reference_filters,
+    find_missing_references,
+    get_association,
+    get_references,
+    read_association_ids,
+    read_related_ids,
+    reference_params,
+    remove_association,
+    replace_association,
+    replace_associations,
+)
+from src.router.utils.bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    MAX_BULK_CHUNK_SIZE,
+    BulkItemResult,
+    BulkResult,
+    Chunk,
+    run_bulk,
+)
+from src.router.utils.cache import item_cache_key, versioned_cache_key
+from src.router.utils.include import Loader, load_included, plan_includes
+from src.router.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CursorPage,
+    after_cursor,
+    decode_cursor,
+    order_by_keys,
+    to_page,
+)
+from src.router.utils.query import SortKey, chunks, compile_filters, compile_sort, memoize, to_camel
+from src.router.utils.stream import STREAM_MEDIA_TYPE, StreamFormat, stream_rows
+from src.router.utils.struct import (
+    dataclass_struct,
+    model_struct,
+    parse_fields,
+    partial_struct,
+    struct_columns,
+    to_struct,
+)
 
 __all__ = (
+    "BULK_CHUNK_SIZE",
+    "FIELDS",
+    "FILTERS",
+    "INCLUDE",
+    "PAGE_LIMIT",
     "BaseController",
     "GenericController",
+    "ItemQuery",
     "delete_item",
+    "insert_item",
     "read_item_by_id",
-    "read_items_by_attrs",
+    "read_items_by_ids",
+    "read_items_page",
+    "select_columns",
+    "select_items_by_attrs",
     "update_item",
 )
 
 
-T = TypeVar("T", bound=DeclarativeBase)
+T = TypeVar("T", bound=Base)
 V = TypeVar("V", bound=BaseDataclass)
+S = TypeVar("S", bound=msgspec.Struct)
 ORM_ATTR = str
 ORM_TABLE = type[Base]
 DATACLASS_ATTR = str
 ATTR_MAP = dict[ORM_ATTR, tuple[DATACLASS_ATTR, ORM_TABLE]]
+PAGE_LIMIT = Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)]
+FILTERS = Annotated[list[str] | None, Parameter(query="filter")]
+FIELDS = Annotated[str | None, Parameter(query="fields")]
+INCLUDE = Annotated[str | None, Parameter(query="include")]
+BULK_CHUNK_SIZE = Annotated[int | None, Parameter(query="chunkSize", ge=1, le=MAX_BULK_CHUNK_SIZE)]
+READ_ONLY_FIELDS = ("id", "created_at", "updated_at")
+# Column values of one row, and the related ids of each of its many-to-many relationships keyed by ORM attribute
+BulkRow = tuple[dict[str, Any], dict[ORM_ATTR, list[UUID]]]
 
 
-async def read_items_by_attrs(
-    session: "AsyncSession",
+@dataclass
+class ItemQuery:
+    """Body of ``POST /<resource>/query``: items by id, narrowed by ``filter`` expressions and ``fields``."""
+
+    ids: list[UUID]
+    filters: list[str] = field(default_factory=list)
+    fields: str | None = None
+
+
+def select_items_by_attrs(
     table: type[Any],
-    selectinload_attrs: list[Any] | None = None,
     id: UUID | list[UUID] | None = None,
+    filters: list[ColumnElement[bool]] | None = None,
     **kwargs: Any,
-) -> Sequence[Any]:
+) -> Select:
     stmt = select(table)
-    if selectinload_attrs:
-        for attr in selectinload_attrs:
-            stmt = stmt.options(selectinload(attr))
+    if filters:
+        stmt = stmt.where(*filters)
     if id:
         processed_id = [id] if isinstance(id, UUID) else id
         stmt = stmt.where(table.__table__.c["id"].in_(processed_id))
     for attr, value in kwargs.items():
         if value is not None:
             stmt = stmt.where(table.__table__.c[attr] == value)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return stmt
+
+
+async def read_items_by_ids(
+    session: "AsyncSession",
+    table: type[Any],
+    ids: Sequence[UUID],
+    filters: list[ColumnElement[bool]] | None = None,
+    columns: Sequence[str] | None = None,
+) -> list[Any]:
+    """Read the items with ``ids`` that pass ``filters``, in the order of ``ids``.
+
+    The ids are bound in chunks that stay under SQLite's variable limit, so the set may be arbitrarily large. With
+    ``columns`` plain rows of those attributes are returned, as in :func:`read_items_page`.
+    """
+    stmt = select_items_by_attrs(table, filters=filters)
+    stmt = stmt.where(table.__table__.c.id.in_(bindparam("ids", expanding=True)))
+    unique = list(dict.fromkeys(ids))
+    found: dict[UUID, Any] = {}
+    if columns is not None:
+        stmt = select_columns(stmt, table, columns)
+        connection = await session.connection()
+        for chunk in chunks(unique):
+            found.update((row.id, row) for row in await connection.execute(stmt, {"ids": chunk}))
+    else:
+        for chunk in chunks(unique):
+            found.update((item.id, item) for item in (await session.execute(stmt, {"ids": chunk})).scalars())
+    return [found[item_id] for item_id in unique if item_id in found]
+
+
+@memoize
+def _select_page(table: type[Any], sort: tuple[tuple[str, bool], ...], reverse: bool) -> Select:
+    """The fixed part of a page read: the order and the limit, with the limit bound at execution.
+
+    ``sort`` holds the name and direction of each sort key, and ``reverse`` reads towards the start of the order.
+    """
+    keys = [SortKey(getattr(table, name), descending) for name, descending in sort]
+    return order_by_keys(select(table), keys, reverse).limit(bindparam("page_limit"))
+
+
+async def read_items_page(
+    session: "AsyncSession",
+    table: type[Any],
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    sort: str | None = None,
+    filters: list[ColumnElement[bool]] | None = None,
+    id: UUID | list[UUID] | None = None,
+    columns: Sequence[str] | None = None,
+    **kwargs: Any,
+) -> CursorPage[Any]:
+    """Read one page of ``table``.
+
+    With ``columns`` only those attributes are selected and the page holds plain ``Row`` objects, read through the
+    session's connection: no instances are built, nothing enters the identity map and nothing is autoflushed.
+
+    The ordered statement is built once per table and sort order. The column filters, ``filters``, the cursor position
+    and the selected columns are added to it per request, with the column filter values and the limit bound at
+    execution.
+    """
+    keys = compile_sort(table, sort)
+    page_cursor = decode_cursor(cursor, keys) if cursor else None
+    stmt = _select_page(
+        table,
+        tuple((key.name, key.descending) for key in keys),
+        page_cursor is not None and page_cursor.direction == "prev",
+    )
+    params: dict[str, Any] = {"page_limit": limit + 1}
+    if id:
+        stmt = stmt.where(table.__table__.c.id.in_(bindparam("page_ids", expanding=True)))
+        params["page_ids"] = [id] if isinstance(id, UUID) else id
+    for attr, value in kwargs.items():
+        if value is not None:
+            stmt = stmt.where(table.__table__.c[attr] == bindparam(f"page_{attr}"))
+            params[f"page_{attr}"] = value
+    if filters:
+        stmt = stmt.where(*filters)
+    if page_cursor is not None:
+        stmt = stmt.where(after_cursor(keys, page_cursor))
+    if columns is None:
+        result = await session.execute(stmt, params)
+        return to_page(list(result.scalars().all()), limit, keys, page_cursor)
+    # The cursor is built from the sort keys, so they are read even when the response leaves them out
+    stmt = select_columns(stmt, table, [*columns, *(key.name for key in keys if key.name not in columns)])
+    connection = await session.connection()
+    rows = await connection.execute(stmt, params)
+    return to_page(list(rows.all()), limit, keys, page_cursor)
+
+
+def select_columns(stmt: Select, table: type[Any], columns: Sequence[str]) -> Select:
+    """Narrow an entity select of ``table`` to the column attributes named in ``columns``."""
+    return stmt.with_only_columns(*(getattr(table, key) for key in columns))
+
+
+@memoize
+def _select_by_id(table: type[Any]) -> Select:
+    return select(table).where(table.__table__.c.id == bindparam("id"))
 
 
 async def read_item_by_id(
     session: "AsyncSession",
     table: type[Any],
     id: "UUID",
-    selectinload_attrs: list[Any] | None = None,
+    options: Sequence[ExecutableOption] = (),
+    columns: Sequence[str] | None = None,
 ) -> Any:
-    stmt = select(table).where(table.__table__.c.id == id)
-    if selectinload_attrs:
-        for attr in selectinload_attrs:
-            stmt = stmt.options(selectinload(attr))
-    result = await session.execute(stmt)
+    """Read one item, or with ``columns`` one plain ``Row`` of just those attributes.
+
+    The statement is built once per table, and ``id`` is bound at execution.
+    """
+    if columns is not None:
+        connection = await session.connection()
+        stmt = select_columns(_select_by_id(table), table, columns)
+        return (await connection.execute(stmt, {"id": id})).one()
+    stmt = _select_by_id(table)
+    result = await session.execute(stmt.options(*options) if options else stmt, {"id": id})
     return result.scalars().one()
 
 
+async def insert_item(session: "AsyncSession", table: type[Any], values: Mapping[str, Any]) -> Any:
+    """Insert one row and return it as written, defaults included, through ``INSERT ... RETURNING``."""
+    result = await session.scalars(insert(table).returning(table), [dict(values)])
+    return result.one()
+
+
 async def update_item(
     session: "AsyncSession",
     id: "UUID",
-    data: "Base",
+    data: "Base | Mapping[str, Any]",
     table: type[Any],
 ) -> "Any":
-    data_dict = data.to_dict()
-    result = await read_item_by_id(session=session, table=table, id=id)
-    for attr, value in data_dict.items():
-        setattr(result, attr, value)
-    return result
+    """Set the supplied columns of one row and return it through ``UPDATE ... RETURNING``.
+
+    ``data`` is either a model, whose ``None`` attributes are left untouched, or a mapping holding exactly the
+    columns to change, which may also set a column to ``None``. Nothing is written when there is nothing to change.
+    """
+    values = dict(data) if isinstance(data, Mapping) else data.to_dict()
+    for attr in READ_ONLY_FIELDS:
+        values.pop(attr, None)
+    if not values:
+        return await read_item_by_id(session=session, table=table, id=id)
+    values["updated_at"] = datetime.now(UTC)
+    if inspect(table).inherits is not None:
+        # A joined-inheritance row spans several tables, which a single UPDATE cannot write in SQLite.
+        try:
+            await session.execute(update(table), [{"id": id, **values}])
+        except StaleDataError as exc:
+            raise NoResultFound(f"No {table.__name__} with id {id}") from exc
+        return await read_item_by_id(session=session, table=table, id=id)
+    stmt = update(table).where(table.__table__.c.id == id).values(values).returning(table)
+    result = await session.scalars(stmt)
+    return result.one()
+
+
+def _convert_fields(data: Mapping[str, Any], types: Mapping[str, tuple[str, Any]]) -> dict[str, Any]:
+    """Validate each field of ``data`` against ``types``, which maps field names to attribute names and types."""
+    values = {}
+    for key, value in data.items():
+        if key not in types:
+            raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail=f"Unknown field '{key}'")
+        name, annotation = types[key]
+        try:
+            values[name] = msgspec.convert(value, annotation, strict=False)
+        except msgspec.ValidationError as exc:
+            raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail=f"Invalid value for '{key}': {exc}") from exc
+    return values
+
+
+def _patch_id(item: Mapping[str, Any]) -> UUID | None:
+    """The ``id`` of a bulk merge-patch item, or ``None`` when it is missing or not a UUID."""
+    try:
+        return UUID(str(item["id"]))
+    except (KeyError, ValueError):
+        return None
+
+
+@memoize
+def _delete_by_id(table: type[Any]) -> Delete:
+    return remove(table).where(table.__table__.c.id == bindparam("id"))
 
 
 async def delete_item(session: "AsyncSession", id: "UUID", table: type[Any]) -> Any:
-    stmt = remove(table).where(table.__table__.c.id == id)
-    await session.execute(stmt)
+    await session.execute(_delete_by_id(table), {"id": id})
 
 
 class GenericController(Controller, Generic[T]):
@@ -99,62 +337,352 @@ class GenericController(Controller, Generic[T]):
 
 
 class BaseController(GenericController[T]):
-    @get()
+    attr_map: ATTR_MAP = {}
+    bulk_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    # List pages are read as plain rows of the response columns instead of ORM instances
+    core_reads: bool = False
+    # How ?include= reads each relationship, where the planner's choice does not suit the data
+    loaders: dict[ORM_ATTR, Loader] = {}
+    # List responses are cached until a write to a table they are read from, for rarely changing reference data
+    cache_lists: bool = False
+    # Single items are cached until a write to that item, or to one of its many-to-many links
+    cache_items: bool = False
+
+    def __init__(self, owner: Router):
+        super().__init__(owner)
+        self.reference_params = reference_params(self.model_type, self.attr_map)
+        self.associations = {orm_attr: get_association(self.model_type, orm_attr) for orm_attr in self.attr_map}
+        self.references = get_references(self.model_type, self.attr_map)
+        # Reads are encoded from a generated Struct rather than through the return DTO
+        self.struct = model_struct(self.model_type)
+        self.signature_namespace[S.__name__] = self.struct  # type: ignore[attr-defined]
+        mapper = inspect(self.model_type)
+        # An item is read from its own tables, and a change to a many-to-many link invalidates the items on both ends
+        self.read_tables: set[TableClause] = {
+            *mapper.tables,
+            *(prop.secondary for prop in mapper.relationships if isinstance(prop.secondary, TableClause)),
+        }
+        self.related_tables = {table for prop in mapper.relationships for table in prop.mapper.tables}
+
+    def get_route_handlers(self) -> list[BaseRouteHandler]:
+        handlers = super().get_route_handlers()
+        cached = {"get_items": self.cache_lists, "get_item_by_id": self.cache_items}
+        for handler in handlers:
+            if isinstance(handler, HTTPRouteHandler) and cached.get(handler.handler_name):
+                handler.cache = CACHE_FOREVER
+                handler.cache_key_builder = self.cache_key
+        return handlers
+
+    def cache_key(self, request: Request[Any, Any, Any]) -> str:
+        """Key a list by its path, query and the versions of the tables it is read from, and an item by its own."""
+        if (item_id := request.path_params.get("id")) is not None:
+            return item_cache_key(request, item_id, inspect(self.model_type).tables, self.read_tables)
+        tables = self.read_tables | self.related_tables if "include" in request.query_params else self.read_tables
+        return versioned_cache_key(request, tables)
+
+    def response_struct(self, fields: str | None) -> type[msgspec.Struct]:
+        """The Struct a read is encoded with: ``struct`` itself, or only the fields asked for in ``?fields=``."""
+        return self.struct if fields is None else partial_struct(self.struct, parse_fields(self.struct, fields))
+
+    def read_columns(self, struct: type[msgspec.Struct]) -> tuple[str, ...] | None:
+        """The columns to select for ``struct``, or ``None`` to load full instances."""
+        if struct is self.struct and not self.core_reads:
+            return None
+        return struct_columns(self.model_type, struct)
+
+    def select_stream(
+        self,
+        table: Any,
+        struct: type[msgspec.Struct],
+        request: Request[Any, Any, Any],
+        id: UUID | list[UUID] | None,
+        title: str | None,
+        sort: str | None,
+        filters: list[str] | None,
+    ) -> Select:
+        """Select the rows of a stream, narrowed to the columns of ``struct`` when only some fields are asked for."""
+        stmt = select_items_by_attrs(table, id=id, filters=self.compile_where(table, filters, request), title=title)
+        if struct is not self.struct:
+            stmt = select_columns(stmt, table, struct_columns(table, struct))
+        return order_by_keys(stmt, compile_sort(table, sort))
+
+    def compile_where(
+        self, table: Any, filters: list[str] | None, request: Request[Any, Any, Any]
+    ) -> list[ColumnElement[bool]]:
+        return compile_filters(table, filters) + compile_reference_filters(
+            table, self.reference_params, request.query_params
+        )
+
+    @get(return_dto=None)
     async def get_items(
         self,
         table: Any,
-        transaction: "AsyncSession",
+        read_session: "AsyncSession",
+        request: Request[Any, Any, Any],
         title: str | None,
         id: UUID | list[UUID] | None = None,
+        limit: PAGE_LIMIT = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        sort: str | None = None,
+        filters: FILTERS = None,
+        fields: FIELDS = None,
+        include: INCLUDE = None,
         **kwargs: Any,
-    ) -> Sequence[T.__name__]:  # type: ignore[name-defined]
-        return cast(
-            Sequence[T],
-            await read_items_by_attrs(transaction, table, title=title, id=id, **kwargs),
+    ) -> "CursorPage[S]":
+        struct = self.response_struct(fields)
+        plan = plan_includes(table, include, self.loaders) if include else []
+        page = await read_items_page(
+            read_session,
+            table,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            filters=self.compile_where(table, filters, request),
+            title=title,
+            id=id,
+            columns=self.read_columns(struct),
+            **kwargs,
+        )
+        if plan:
+            page.included = await load_included(read_session, table, plan, page.items)
+        page.items = [to_struct(struct, item) for item in page.items]
+        return page
+
+    @get("/stream", return_dto=None)
+    async def stream_items(
+        self,
+        table: Any,
+        stream_reader: AsyncEngine,
+        request: Request[Any, Any, Any],
+        title: str | None = None,
+        id: UUID | list[UUID] | None = None,
+        sort: str | None = None,
+        filters: FILTERS = None,
+        fields: FIELDS = None,
+        format: StreamFormat = "ndjson",
+    ) -> Stream:
+        struct = self.response_struct(fields)
+        stmt = self.select_stream(table, struct, request, id, title, sort, filters)
+        return Stream(
+            stream_rows(stream_reader, stmt, partial(to_struct, struct), format, rows=struct is not self.struct),
+            media_type=STREAM_MEDIA_TYPE[format],
         )
 
-    @get("/{id:uuid}")
+    @get("/{id:uuid}", return_dto=None)
     async def get_item_by_id(
         self,
         table: Any,
-        transaction: "AsyncSession",
+        read_session: "AsyncSession",
         id: UUID,
-    ) -> T.__name__:  # type: ignore[name-defined]
-        return cast(
-            T,
-            await read_item_by_id(session=transaction, table=table, id=id),
+        fields: FIELDS = None,
+    ) -> S.__name__:  # type: ignore[name-defined]
+        struct = self.response_struct(fields)
+        item = await read_item_by_id(read_session, table, id, columns=self.read_columns(struct))
+        return to_struct(struct, item)
+
+    @post("/query", dto=None, return_dto=None, status_code=HTTP_200_OK)
+    async def query_items(
+        self,
+        table: Any,
+        read_session: "AsyncSession",
+        request: Request[Any, Any, Any],
+        data: ItemQuery,
+    ) -> "list[S]":
+        """Read many items by id, in the order given; ids that do not exist or fail the filters are left out."""
+        struct = self.response_struct(data.fields)
+        items = await read_items_by_ids(
+            read_session,
+            table,
+            data.ids,
+            filters=self.compile_where(table, data.filters, request),
+            columns=self.read_columns(struct),
         )
+        return await self.to_structs(read_session, items, struct)
 
-    @post()
+    @post(return_dto=None)
     async def create_item(
         self,
         transaction: "AsyncSession",
         table: Any,
         data: T.__name__,  # type: ignore[name-defined]
-    ) -> T.__name__:  # type: ignore[name-defined]
-        transaction.add(data)
-        await transaction.flush()
-        return await read_item_by_id(transaction, table, data.id)
+    ) -> S.__name__:  # type: ignore[name-defined]
+        values = data.to_dict()
+        await self.check_references(transaction, [(values, {})])
+        return to_struct(self.struct, await insert_item(transaction, table, values))
 
-    @put("/{id:uuid}")
+    @put("/{id:uuid}", return_dto=None)
     async def update_item(
         self,
         table: Any,
         transaction: "AsyncSession",
         id: UUID,
         data: T.__name__,  # type: ignore[name-defined]
-    ) -> T.__name__:  # type: ignore[name-defined]
-        return await update_item(session=transaction, id=id, data=data, table=table)
+    ) -> S.__name__:  # type: ignore[name-defined]
+        values = data.to_dict()
+        await self.check_references(transaction, [(values, {})])
+        return to_struct(self.struct, await update_item(session=transaction, id=id, data=values, table=table))
+
+    @patch("/{id:uuid}", dto=None, return_dto=None)
+    async def patch_item(
+        self,
+        table: Any,
+        transaction: "AsyncSession",
+        id: UUID,
+        data: dict[str, Any],
+    ) -> S.__name__:  # type: ignore[name-defined]
+        """Merge-patch: only the fields present in the body are written, ``null`` clears a field."""
+        values = self.parse_patch(data)
+        await self.check_references(transaction, [(values, {})])
+        return to_struct(self.struct, await update_item(session=transaction, id=id, data=values, table=table))
 
     @delete("/{id:uuid}")
     async def delete_item(self, table: Any, transaction: "AsyncSession", id: UUID) -> None:
         await delete_item(session=transaction, id=id, table=table)
 
+    @post("/bulk", return_dto=None, status_code=HTTP_200_OK)
+    async def create_items(
+        self,
+        table: Any,
+        db_session: "AsyncSession",
+        data: "list[T]",
+        chunk_size: BULK_CHUNK_SIZE = None,
+    ) -> BulkResult:
+        rows = [self.split_related(item.to_dict()) for item in data]
+        return await run_bulk(db_session, rows, chunk_size or self.bulk_chunk_size, partial(self.insert_rows, table))
+
+    @patch("/bulk", dto=None, return_dto=None)
+    async def update_items(
+        self,
+        table: Any,
+        db_session: "AsyncSession",
+        data: list[dict[str, Any]],
+        chunk_size: BULK_CHUNK_SIZE = None,
+    ) -> BulkResult:
+        """Merge-patch many items, each given as an object holding its ``id`` and the fields to change."""
+        return await run_bulk(
+            db_session, data, chunk_size or self.bulk_chunk_size, partial(self.update_rows, table), _patch_id
+        )
+
+    @delete("/bulk", dto=None, return_dto=None, status_code=HTTP_200_OK)
+    async def delete_items(
+        self,
+        table: Any,
+        db_session: "AsyncSession",
+        data: list[UUID],
+        chunk_size: BULK_CHUNK_SIZE = None,
+    ) -> BulkResult:
+        return await run_bulk(
+            db_session, data, chunk_size or self.bulk_chunk_size, partial(self.delete_rows, table), lambda id: id
+        )
+
+    async def to_structs(
+        self, session: AsyncSession, items: Sequence[Any], struct: type[msgspec.Struct] | None = None
+    ) -> list[Any]:
+        struct = struct or self.struct
+        return [to_struct(struct, item) for item in items]
+
+    async def check_references(
+        self, session: "AsyncSession", rows: Sequence[BulkRow], pending: Collection[UUID] = ()
+    ) -> None:
+        """Reject ``rows`` with a 422 listing every referenced id that does not exist, checked in one query.
+
+        ``pending`` holds ids of items created in the same batch, which may be referenced by the others.
+        """
+        missing = await find_missing_references(
+            session,
+            self.references,
+            [{**values, **related} for values, related in rows],
+            {table: pending for table in inspect(self.model_type).tables} if pending else None,
+        )
+        if missing:
+            raise ClientException(
+                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Referenced items do not exist",
+                extra={name: [str(item_id) for item_id in ids] for name, ids in missing.items()},
+            )
+
+    def split_related(self, values: dict[str, Any]) -> BulkRow:
+        """Separate the related ids of ``attr_map`` relationships from the column values."""
+        related = {
+            orm_attr: list(dict.fromkeys(values.pop(dc_attr)))
+            for orm_attr, (dc_attr, _) in self.attr_map.items()
+            if dc_attr in values
+        }
+        return values, related
+
+    def parse_patch(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate a merge-patch body field by field against the writable columns, keyed by attribute name."""
+        types = {}
+        for attr in inspect(self.model_type).column_attrs:
+            column = attr.columns[0]
+            field = column.info.get(DTO_FIELD_META_KEY)
+            if attr.key in READ_ONLY_FIELDS or (field is not None and field.mark in (Mark.READ_ONLY, Mark.PRIVATE)):
+                continue
+            try:
+                python_type: Any = column.type.python_type
+            except NotImplementedError:
+                python_type = Any
+            types[to_camel(attr.key)] = (attr.key, python_type | None if column.nullable else python_type)
+        return _convert_fields(data, types)
+
+    async def insert_rows(self, table: Any, session: "AsyncSession", chunk: Chunk[BulkRow]) -> list[BulkItemResult]:
+        """Insert a chunk with one executemany INSERT and one per relationship.
+
+        Ids are generated up front so that the association rows can be written without reading the items back.
+        """
+        rows = [{**values, "id": values.get("id") or uuid4()} for _, (values, _) in chunk]
+        await self.check_references(session, [row for _, row in chunk], pending=[row["id"] for row in rows])
+        await session.execute(insert(table), rows)
+        for orm_attr, association in self.associations.items():
+            targets = {row["id"]: related.get(orm_attr, []) for row, (_, (_, related)) in zip(rows, chunk, strict=True)}
+            await add_associations(session, association, targets)
+        return [
+            BulkItemResult(index=index, status=HTTP_201_CREATED, id=row["id"])
+            for (index, _), row in zip(chunk, rows, strict=True)
+        ]
+
+    async def update_rows(
+        self, table: Any, session: "AsyncSession", chunk: Chunk[dict[str, Any]]
+    ) -> list[BulkItemResult]:
+        """Update a chunk with one executemany UPDATE by primary key and one diff per relationship."""
+        now = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
+        parsed: list[BulkRow] = []
+        targets: dict[str, dict[UUID, list[UUID]]] = {orm_attr: {} for orm_attr in self.associations}
+        for _, item in chunk:
+            if (item_id := _patch_id(item)) is None:
+                raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail="Every item needs a valid 'id'")
+            data = dict(item)
+            del data["id"]
+            values, related = self.split_related(self.parse_patch(data))
+            parsed.append((values, related))
+            rows.append({**values, "id": item_id, "updated_at": now})
+            for orm_attr, ids in related.items():
+                targets[orm_attr][item_id] = ids
+        await self.check_references(session, parsed)
+        await session.execute(update(table), rows)
+        for orm_attr, association in self.associations.items():
+            await replace_associations(session, association, targets[orm_attr])
+        return [
+            BulkItemResult(index=index, status=HTTP_200_OK, id=row["id"])
+            for (index, _), row in zip(chunk, rows, strict=True)
+        ]
+
+    async def delete_rows(self, table: Any, session: "AsyncSession", chunk: Chunk[UUID]) -> list[BulkItemResult]:
+        stmt = remove(table.__table__).where(table.__table__.c.id.in_([item_id for _, item_id in chunk]))
+        deleted = set(await session.scalars(stmt.returning(table.__table__.c.id)))
+        missing = "No database result matching query"
+        return [
+            BulkItemResult(index=index, status=HTTP_200_OK, id=item_id)
+            if item_id in deleted
+            else BulkItemResult(index=index, status=HTTP_404_NOT_FOUND, id=item_id, detail=missing)
+            for index, item_id in chunk
+        ]
+
 
 class DataclassController(BaseController[T], Generic[T, V]):
     attr_map: ATTR_MAP
     dataclass: type[V]
-    selectinload_attrs: list[Any]
 
     def __class_getitem__(cls, key: tuple[type[T], type[V]]) -> type:
         return type(f"Controller[{key[0].__name__}]", (cls,), {"model_type": key[0], "dataclass": key[1]})
@@ -162,57 +690,189 @@ class DataclassController(BaseController[T], Generic[T, V]):
     def __init__(self, owner: Router):
         super().__init__(owner)
         self.signature_namespace[V.__name__] = self.dataclass  # type: ignore[misc]
+        self.struct = dataclass_struct(self.dataclass)
+        self.signature_namespace[S.__name__] = self.struct  # type: ignore[attr-defined]
 
-    @get()
+    @get(return_dto=None)
     async def get_items(
         self,
         table: Any,
-        transaction: "AsyncSession",
+        read_session: "AsyncSession",
+        request: Request[Any, Any, Any],
         title: str | None,
         id: UUID | list[UUID] | None = None,
+        limit: PAGE_LIMIT = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        sort: str | None = None,
+        filters: FILTERS = None,
+        fields: FIELDS = None,
+        include: INCLUDE = None,
         **kwargs: Any,
-    ) -> Sequence[V.__name__]:  # type: ignore[name-defined]
-        return cast(
-            Sequence[V],
-            await read_items_by_attrs(
-                transaction, table, title=title, id=id, selectinload_attrs=self.selectinload_attrs, **kwargs
+    ) -> "CursorPage[S]":
+        struct = self.response_struct(fields)
+        plan = plan_includes(table, include, self.loaders) if include else []
+        page = await read_items_page(
+            read_session,
+            table,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            filters=self.compile_where(table, filters, request),
+            title=title,
+            id=id,
+            columns=self.read_columns(struct),
+            **kwargs,
+        )
+        if plan:
+            page.included = await load_included(read_session, table, plan, page.items)
+        page.items = await self.to_structs(read_session, page.items, struct)
+        return page
+
+    @get("/stream", return_dto=None)
+    async def stream_items(
+        self,
+        table: Any,
+        stream_reader: AsyncEngine,
+        request: Request[Any, Any, Any],
+        title: str | None = None,
+        id: UUID | list[UUID] | None = None,
+        sort: str | None = None,
+        filters: FILTERS = None,
+        fields: FIELDS = None,
+        format: StreamFormat = "ndjson",
+    ) -> Stream:
+        struct = self.response_struct(fields)
+        stmt = self.select_stream(table, struct, request, id, title, sort, filters)
+        return Stream(
+            stream_rows(
+                stream_reader,
+                stmt,
+                format=format,
+                load=partial(self.to_structs, struct=struct),
+                rows=struct is not self.struct,
             ),
+            media_type=STREAM_MEDIA_TYPE[format],
         )
 
-    @get("/{id:uuid}")
-    async def get_item_by_id(self, table: Any, transaction: AsyncSession, id: UUID) -> V.__name__:  # type: ignore[name-defined]
-        data = await read_item_by_id(transaction, table, id, self.selectinload_attrs)
-        return cast(V, self.dataclass.from_orm(data))
+    @get("/{id:uuid}", return_dto=None)
+    async def get_item_by_id(
+        self, table: Any, read_session: AsyncSession, id: UUID, fields: FIELDS = None
+    ) -> S.__name__:  # type: ignore[name-defined]
+        struct = self.response_struct(fields)
+        data = await read_item_by_id(read_session, table, id, columns=self.read_columns(struct))
+        (item,) = await self.to_structs(read_session, [data], struct)
+        return item
 
     @post()
     async def create_item(self, table: Any, transaction: AsyncSession, data: V.__name__) -> V.__name__:  # type: ignore[name-defined]
-        data_dict = await self.prepare_data_dict(transaction, data)
-        table_data = table(**data_dict)
-        transaction.add(table_data)
-        await transaction.flush()
-        return cast(V, self.dataclass.from_orm(table_data))
+        values, related = self.split_related(data.to_dict())
+        await self.check_references(transaction, [(values, related)])
+        item = await insert_item(transaction, table, values)
+        for orm_attr, ids in related.items():
+            await add_association(transaction, self.associations[orm_attr], item.id, ids)
+        return self.to_dataclass(item, related)
 
     @put("{id:uuid}")
     async def update_item(self, table: Any, transaction: AsyncSession, data: V.__name__, id: UUID) -> V.__name__:  # type: ignore[name-defined]
-        # Fetch item
-        item = cast(
-            T,
-            await read_item_by_id(session=transaction, table=table, id=id, selectinload_attrs=self.selectinload_attrs),
-        )
-        # Fetch parents
-        data_dict = await self.prepare_data_dict(transaction, data)
-        for k, v in data_dict.items():
-            setattr(item, k, v)
-        return cast(V, self.dataclass.from_orm(cast(Serialisable, item)))
-
-    async def prepare_data_dict(self, session: AsyncSession, data: V) -> dict[str, Any]:
         data_dict = data.to_dict()
-
-        for orm_attr, (dc_attr, table) in self.attr_map.items():
-            if dc_attr in data_dict:
-                data_dict.pop(dc_attr)
-            if hasattr(data, dc_attr) and len(getattr(data, dc_attr)) > 0:
-                orm_obj = await read_items_by_attrs(session=session, table=cast(Any, table), id=getattr(data, dc_attr))
-                data_dict[orm_attr] = orm_obj
-
-        return data_dict
+        # An empty list leaves the relationship unchanged
+        related = {
+            orm_attr: ids for orm_attr, (dc_attr, _) in self.attr_map.items() if (ids := data_dict.pop(dc_attr, None))
+        }
+        return await self.write_item(transaction, table, id, data_dict, related)
+
+    @patch("/{id:uuid}", dto=None)
+    async def patch_item(self, table: Any, transaction: AsyncSession, id: UUID, data: dict[str, Any]) -> V.__name__:  # type: ignore[name-defined]
+        """Merge-patch: only the fields present in the body are written, ``null`` clears a field."""
+        values, related = self.split_related(self.parse_patch(data))
+        return await self.write_item(transaction, table, id, values, related)
+
+    @post("/bulk", return_dto=None, status_code=HTTP_200_OK)
+    async def create_items(
+        self,
+        table: Any,
+        db_session: AsyncSession,
+        data: "list[V]",
+        chunk_size: BULK_CHUNK_SIZE = None,
+    ) -> BulkResult:
+        rows = [self.split_related(item.to_dict()) for item in data]
+        return await run_bulk(db_session, rows, chunk_size or self.bulk_chunk_size, partial(self.insert_rows, table))
+
+    @patch("/{id:uuid}/{relationship:str}", dto=None, return_dto=None)
+    async def update_members(
+        self,
+        table: Any,
+        transaction: AsyncSession,
+        id: UUID,
+        relationship: str,
+        data: AssociationDelta,
+    ) -> S.__name__:  # type: ignore[name-defined]
+        orm_attr = next((attr for attr in self.attr_map if to_camel(attr) == relationship), None)
+        if orm_attr is None:
+            raise NotFoundException(detail=f"Unknown relationship '{relationship}'")
+        item = await read_item_by_id(transaction, table, id)
+        await self.check_references(transaction, [({}, {orm_attr: data.add})])
+        association = self.associations[orm_attr]
+        await remove_association(transaction, association, id, data.remove)
+        await add_association(transaction, association, id, data.add)
+        (result,) = await self.to_structs(transaction, [item])
+        return result
+
+    async def write_item(
+        self,
+        session: AsyncSession,
+        table: Any,
+        id: UUID,
+        values: Mapping[str, Any],
+        related: Mapping[str, list[UUID]],
+    ) -> V:
+        await self.check_references(session, [(dict(values), dict(related))])
+        item = await update_item(session=session, id=id, data=values, table=table)
+        ids = {}
+        for orm_attr, association in self.associations.items():
+            if orm_attr in related:
+                ids[orm_attr] = list(dict.fromkeys(related[orm_attr]))
+                await replace_association(session, association, id, ids[orm_attr])
+            else:
+                ids[orm_attr] = await read_association_ids(session, association, id)
+        return self.to_dataclass(item, ids)
+
+    def parse_patch(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate a merge-patch body field by field against the dataclass, keyed by attribute name."""
+        hints = get_type_hints(self.dataclass)
+        types = {
+            to_camel(field.name): (field.name, hints[field.name])
+            for field in fields(self.dataclass)
+            if field.name not in READ_ONLY_FIELDS
+        }
+        return _convert_fields(data, types)
+
+    async def to_structs(
+        self, session: AsyncSession, items: Sequence[Any], struct: type[msgspec.Struct] | None = None
+    ) -> list[Any]:
+        """Build the responses for ``items`` with one query per relationship that reads only the related ids.
+
+        Columns are copied straight from each row into the generated Struct, and related rows are never loaded. Only
+        the relationships that ``struct`` has a field for are read.
+        """
+        struct = struct or self.struct
+        owner_ids = [item.id for item in items]
+        related = {
+            dc_attr: await read_related_ids(session, self.associations[orm_attr], owner_ids)
+            for orm_attr, (dc_attr, _) in self.attr_map.items()
+            if dc_attr in struct.__struct_fields__
+        }
+        structs = []
+        for item in items:
+            result = to_struct(struct, item)
+            for dc_attr, ids in related.items():
+                setattr(result, dc_attr, ids[item.id])
+            structs.append(result)
+        return structs
+
+    def to_dataclass(self, item: Any, related: Mapping[str, list[UUID]]) -> V:
+        """Build the response from a row and the ids of its related items, without loading the relationships."""
+        data_dict = item.to_dict()
+        for orm_attr, (dc_attr, _) in self.attr_map.items():
+            data_dict[dc_attr] = list(related.get(orm_attr, []))
+        return self.dataclass(**data_dict)
@@ -17,7 +17,7 @@ BiologicalMaterialReturnDTO = DTOGenerator[BiologicalMaterial]()
 
 class BiologicalMaterialController(DataclassController[BiologicalMaterial, BiologicalMaterialDataclass]):
     path = "/biologicalMaterial"
+    core_reads = True
     dto = BiologicalMaterialDTO
     return_dto = BiologicalMaterialDTO
     attr_map = {"studies": ("study_id", Study)}
-    selectinload_attrs = [BiologicalMaterial.studies]
@@ -20,4 +20,3 @@ class DataFileController(DataclassController[DataFile, DataFileDataclass]):
     dto = DataFileDTO
     return_dto = DataFileDTO
     attr_map = {"studies": ("study_id", Study)}
-    selectinload_attrs = [DataFile.studies]
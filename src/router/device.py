@@ -10,5 +10,7 @@ DeviceDTO = DTOGenerator[Device](read_kwargs={"max_nested_depth": 1})
 
 class DeviceController(BaseController[Device]):
     path = "/device"
+    cache_lists = True
+    cache_items = True
     dto = DeviceDTO.write_dto
     return_dto = DeviceDTO.read_dto
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Any
+
+from litestar import Controller, Request, get
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.helpers import SQLiteProfile, read_pragmas
+from src.router.utils.cache import CacheStats, LRUStore
+
+__all__ = ("DiagnosticsController", "SQLiteDiagnostics")
+
+
+@dataclass
+class SQLiteDiagnostics:
+    profile: SQLiteProfile
+    """The configured profile."""
+    pragmas: dict[str, Any]
+    """Settings in effect on a reader connection."""
+    sqlite_version: str
+
+
+class DiagnosticsController(Controller):
+    path = "/diagnostics"
+
+    @get("/sqlite")
+    async def get_sqlite(self, read_session: AsyncSession, sqlite_profile: SQLiteProfile) -> SQLiteDiagnostics:
+        connection = await read_session.connection()
+        return SQLiteDiagnostics(
+            profile=sqlite_profile,
+            pragmas=await read_pragmas(connection),
+            sqlite_version=await connection.scalar(text("SELECT sqlite_version()")),
+        )
+
+    @get("/cache")
+    async def get_cache(self, request: Request[Any, Any, Any]) -> CacheStats | None:
+        """Size and hit rate of the list response cache, if it is held in an :class:`LRUStore`."""
+        store = request.app.response_cache_config.get_store_from_app(request.app)
+        return store.stats() if isinstance(store, LRUStore) else None
@@ -20,4 +20,3 @@ class EnvironmentController(DataclassController[Environment, EnvironmentDataclas
     dto = EnvironmentDTO
     return_dto = EnvironmentDTO
     attr_map = {"studies": ("study_id", Study)}
-    selectinload_attrs = [Environment.studies]
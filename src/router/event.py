@@ -24,4 +24,3 @@ class EventController(DataclassController[Event, EventDataclass]):
         "studies": ("study_id", Study),
         "observation_units": ("observation_unit_id", ObservationUnit),
     }
-    selectinload_attrs = [Event.studies, Event.observation_units]
@@ -21,4 +21,3 @@ class ExperimentController(DataclassController[Experiment, ExperimentDataclass])
     dto = ExperimentDTO
     return_dto = ExperimentDTO
     attr_map = {"facilities": ("facility_id", Facility), "staffs": ("staff_id", Staff)}
-    selectinload_attrs = [Experiment.facilities, Experiment.staffs]
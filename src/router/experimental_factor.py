@@ -20,4 +20,3 @@ class ExperimentalFactorController(DataclassController[ExperimentalFactor, Exper
     dto = ExperimentalFactorDTO
     return_dto = ExperimentalFactorDTO
     attr_map = {"studies": ("study_id", Study)}
-    selectinload_attrs = [ExperimentalFactor.studies]
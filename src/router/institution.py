@@ -16,7 +16,8 @@ InstitutionReturnDTO = DTOGenerator[Institution]()
 
 class InstitutionController(DataclassController[Institution, InstitutionDataclass]):
     path = "/institution"
+    cache_lists = True
+    cache_items = True
     dto = InstitutionDTO
     return_dto = InstitutionDTO
     attr_map = {"parents": ("parent_id", Institution)}
-    selectinload_attrs = [Institution.parents]
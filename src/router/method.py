@@ -10,5 +10,7 @@ MethodDTO = DTOGenerator[Method]()
 
 class MethodController(BaseController[Method]):
     path = "/method"
+    cache_lists = True
+    cache_items = True
     dto = MethodDTO.read_dto
     return_dto = MethodDTO.write_dto
@@ -5,6 +5,7 @@ from src.model.observation_unit import ObservationUnit, ObservationUnitDataclass
 from src.model.study import Study
 from src.router.base import DataclassController
 from src.router.utils.dto import DTOGenerator
+from src.router.utils.include import Loader
 
 __all__ = ("ObservationUnitController",)
 
@@ -18,6 +19,8 @@ ObservationUnitReturnDTO = DTOGenerator[ObservationUnit]()
 
 class ObservationUnitController(DataclassController[ObservationUnit, ObservationUnitDataclass]):
     path = "/observationUnit"
+    core_reads = True
+    cache_items = True
     dto = ObservationUnitDTO
     return_dto = ObservationUnitDTO
     attr_map = {
@@ -25,4 +28,11 @@ class ObservationUnitController(DataclassController[ObservationUnit, Observation
         "studies": ("study_id", Study),
         "experimental_factors": ("experimental_factor_id", ExperimentalFactor),
     }
-    selectinload_attrs = [ObservationUnit.parents, ObservationUnit.studies, ObservationUnit.experimental_factors]
+    # A page shares few facilities and types, which are read once by id. Collections are joined from the page.
+    loaders = {
+        "facility": Loader.BY_ID,
+        "observation_unit_type": Loader.BY_ID,
+        "samples": Loader.BY_OWNER,
+        "events": Loader.BY_OWNER,
+        "children": Loader.BY_OWNER,
+    }
@@ -20,4 +20,3 @@ class ObservedVariableController(DataclassController[ObservedVariable, ObservedV
     dto = ObservedVariableDTO
     return_dto = ObservedVariableDTO
     attr_map = {"studies": ("study_id", Study)}
-    selectinload_attrs = [ObservedVariable.studies]
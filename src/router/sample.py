@@ -10,5 +10,6 @@ SampleDTO = DTOGenerator[Sample]()
 
 class SampleController(BaseController[Sample]):
     path = "/sample"
+    core_reads = True
     dto = SampleDTO.write_dto
     return_dto = SampleDTO.read_dto
@@ -17,7 +17,7 @@ StaffReturnDTO = DTOGenerator[Staff]()
 
 class StaffController(DataclassController[Staff, StaffDataclass]):
     path = "/staff"
+    cache_items = True
     dto = StaffDTO
     return_dto = StaffDTO
     attr_map = {"institutions": ("institution_id", Institution)}
-    selectinload_attrs = [Staff.institutions]
@@ -1,6 +1,7 @@
 from src.model import Study
 from src.router.base import BaseController
 from src.router.utils.dto import DTOGenerator
+from src.router.utils.include import Loader
 
 __all__ = ("StudyController",)
 
@@ -10,5 +11,12 @@ StudyDTO = DTOGenerator[Study]()
 
 class StudyController(BaseController[Study]):
     path = "/study"
+    cache_items = True
     dto = StudyDTO.write_dto
     return_dto = StudyDTO.read_dto
+    # Most studies of a page belong to a handful of investigations, which are read once by id
+    loaders = {
+        "investigation": Loader.BY_ID,
+        "observation_unit": Loader.BY_OWNER,
+        "experiments": Loader.BY_OWNER,
+    }
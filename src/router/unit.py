@@ -9,5 +9,7 @@ UnitDTO = DTOGenerator[Unit]()
 
 class UnitController(BaseController[Unit]):
     path = "/unit"
+    cache_lists = True
+    cache_items = True
     dto = UnitDTO.write_dto
     return_dto = UnitDTO.read_dto
@@ -0,0 +1,282 @@
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from litestar.datastructures import MultiDict
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_400_BAD_REQUEST
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    Table,
+    TableClause,
+    bindparam,
+    delete,
+    exists,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.router.utils.query import IN_CHUNK_SIZE, chunks, to_camel
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import RelationshipProperty
+
+__all__ = (
+    "Association",
+    "AssociationDelta",
+    "Reference",
+    "add_association",
+    "add_associations",
+    "compile_reference_filters",
+    "find_missing_references",
+    "get_association",
+    "get_references",
+    "read_association_ids",
+    "read_related_ids",
+    "reference_params",
+    "remove_association",
+    "remove_associations",
+    "replace_association",
+    "replace_associations",
+)
+
+
+@dataclass(frozen=True)
+class Association:
+    """The association table behind a many-to-many relationship, seen from the owning side."""
+
+    table: Table
+    owner: ColumnElement[Any]
+    """Primary key column of the owning model that the association table references."""
+    local: Column[Any]
+    """Association column holding the owner id."""
+    remote: Column[Any]
+    """Association column holding the related item id."""
+
+
+@dataclass
+class AssociationDelta:
+    add: list[UUID] = field(default_factory=list)
+    remove: list[UUID] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A foreign key column or many-to-many relationship of a model, and the id column it points at."""
+
+    name: str
+    """Field name used in request bodies and error details."""
+    target: Column[Any]
+
+
+def get_association(table: type[Any], orm_attr: str) -> Association:
+    prop: "RelationshipProperty[Any]" = inspect(table).relationships[orm_attr]
+    if prop.secondary is None or prop.secondary_synchronize_pairs is None:
+        raise ValueError(f"{table.__name__}.{orm_attr} is not a many-to-many relationship")
+    ((owner, local),) = prop.synchronize_pairs
+    ((_, remote),) = prop.secondary_synchronize_pairs
+    return Association(table=prop.secondary, owner=owner, local=local, remote=remote)  # type: ignore[arg-type]
+
+
+def reference_params(table: type[Any], attr_map: Mapping[str, tuple[str, Any]]) -> dict[str, str]:
+    """Map query parameter names to the foreign key columns and many-to-many relationships they filter on.
+
+    Scalar foreign keys use their column name (``facilityId``), relationships use the dataclass attribute from
+    ``attr_map`` (``studyId``).
+    """
+    params = {
+        to_camel(attr.key): attr.key
+        for attr in inspect(table).column_attrs
+        if attr.key != "id" and any(column.foreign_keys for column in attr.columns)
+    }
+    for orm_attr, (dc_attr, _) in attr_map.items():
+        params[to_camel(dc_attr)] = orm_attr
+    return params
+
+
+def get_references(table: type[Any], attr_map: Mapping[str, tuple[str, Any]]) -> dict[str, Reference]:
+    """Map foreign key column keys and ``attr_map`` relationships to the id columns they reference."""
+    references = {}
+    for attr in inspect(table).column_attrs:
+        column = attr.columns[0]
+        if attr.key != "id" and column.foreign_keys:
+            references[attr.key] = Reference(name=to_camel(attr.key), target=next(iter(column.foreign_keys)).column)
+    for orm_attr, (dc_attr, _) in attr_map.items():
+        remote = get_association(table, orm_attr).remote
+        references[orm_attr] = Reference(name=to_camel(dc_attr), target=next(iter(remote.foreign_keys)).column)
+    return references
+
+
+async def find_missing_references(
+    session: AsyncSession,
+    references: Mapping[str, Reference],
+    rows: Iterable[Mapping[str, Any]],
+    pending: Mapping[TableClause, Collection[UUID]] | None = None,
+) -> dict[str, list[UUID]]:
+    """Find the referenced ids in ``rows`` that do not exist, grouped by field name.
+
+    Each row maps column keys to scalar ids or ORM attributes to lists of ids. Every referenced table is checked in
+    the same round trip through one ``UNION ALL``, repeated for every chunk of ids under SQLite's variable limit.
+    ``pending`` holds, per table, ids of rows that are written in the same batch and so count as existing.
+    """
+    wanted: dict[str, set[UUID]] = {}
+    for row in rows:
+        for key in references:
+            value = row.get(key)
+            if value is None:
+                continue
+            wanted.setdefault(key, set()).update(value if isinstance(value, list | tuple | set) else [value])
+    targets: dict[Column[Any], set[UUID]] = {}
+    for key, ids in wanted.items():
+        targets.setdefault(references[key].target, set()).update(ids)
+    if not targets:
+        return {}
+    columns = list(targets)
+    found: dict[Column[Any], set[UUID]] = {column: set() for column in columns}
+    pairs = [(index, item_id) for index, column in enumerate(columns) for item_id in targets[column]]
+    for chunk in chunks(pairs):
+        by_column: dict[int, list[UUID]] = {}
+        for index, item_id in chunk:
+            by_column.setdefault(index, []).append(item_id)
+        selects = [
+            select(literal(index).label("target"), columns[index].label("id")).where(columns[index].in_(column_ids))
+            for index, column_ids in by_column.items()
+        ]
+        stmt: Select[Any] | CompoundSelect = selects[0] if len(selects) == 1 else union_all(*selects)
+        for index, item_id in await session.execute(stmt):
+            found[columns[index]].add(item_id)
+    missing = {}
+    for key, ids in wanted.items():
+        target = references[key].target
+        if absent := ids - found[target] - set((pending or {}).get(target.table, ())):
+            missing[references[key].name] = sorted(absent)
+    return missing
+
+
+def _parse_ids(name: str, values: list[str]) -> list[UUID]:
+    try:
+        return [UUID(item) for value in values for item in value.split(",")]
+    except ValueError as exc:
+        raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail=f"Invalid id in '{name}'") from exc
+
+
+def compile_reference_filters(
+    table: type[Any],
+    params: Mapping[str, str],
+    query: MultiDict[Any],
+) -> list[ColumnElement[bool]]:
+    """Compile ``?studyId=...`` style parameters into where clauses.
+
+    Foreign key columns are compared directly. Many-to-many memberships become an ``EXISTS`` on the association
+    table, so the related table is never joined and the answer comes from the association index.
+    """
+    clauses: list[ColumnElement[bool]] = []
+    mapper = inspect(table)
+    for name, attr in params.items():
+        if not (values := query.getall(name, [])):
+            continue
+        ids = _parse_ids(name, values)
+        if attr in mapper.relationships:
+            association = get_association(table, attr)
+            clauses.append(
+                exists().where(association.local == association.owner, association.remote.in_(ids)),
+            )
+        else:
+            clauses.append(getattr(table, attr).in_(ids))
+    return clauses
+
+
+def _pairs(targets: Mapping[UUID, Collection[UUID]]) -> list[tuple[UUID, UUID]]:
+    return [(owner_id, item_id) for owner_id, ids in targets.items() for item_id in ids]
+
+
+async def add_associations(
+    session: AsyncSession, association: Association, targets: Mapping[UUID, Collection[UUID]]
+) -> None:
+    """Link every owner id in ``targets`` to its related ids with one executemany INSERT, skipping existing rows."""
+    if pairs := _pairs(targets):
+        stmt = insert(association.table).on_conflict_do_nothing()
+        rows = [{association.local.key: owner, association.remote.key: item_id} for owner, item_id in pairs]
+        await session.execute(stmt, rows)
+
+
+async def remove_associations(
+    session: AsyncSession, association: Association, targets: Mapping[UUID, Collection[UUID]]
+) -> None:
+    # Each pair binds two variables
+    for chunk in chunks(_pairs(targets), IN_CHUNK_SIZE // 2):
+        stmt = delete(association.table).where(tuple_(association.local, association.remote).in_(chunk))
+        await session.execute(stmt)
+
+
+async def add_association(
+    session: AsyncSession, association: Association, owner_id: UUID, ids: Collection[UUID]
+) -> None:
+    await add_associations(session, association, {owner_id: ids})
+
+
+async def remove_association(
+    session: AsyncSession, association: Association, owner_id: UUID, ids: Collection[UUID]
+) -> None:
+    for chunk in chunks(list(ids)):
+        stmt = delete(association.table).where(association.local == owner_id, association.remote.in_(chunk))
+        await session.execute(stmt)
+
+
+async def read_association_ids(session: AsyncSession, association: Association, owner_id: UUID) -> list[UUID]:
+    return list(await session.scalars(select(association.remote).where(association.local == owner_id)))
+
+
+async def read_related_ids(
+    session: AsyncSession, association: Association, owner_ids: Collection[UUID]
+) -> dict[UUID, list[UUID]]:
+    """Group the related ids of many owners with one query on the association table.
+
+    Only the association index is read; the related rows themselves are never loaded. Large sets of owners are read
+    in chunks.
+    """
+    related: dict[UUID, list[UUID]] = {owner: [] for owner in owner_ids}
+    stmt = select(association.local, association.remote).where(
+        association.local.in_(bindparam("owners", expanding=True))
+    )
+    for chunk in chunks(list(related)):
+        for owner, item_id in await session.execute(stmt, {"owners": chunk}):
+            related[owner].append(item_id)
+    return related
+
+
+async def replace_associations(
+    session: AsyncSession, association: Association, targets: Mapping[UUID, Collection[UUID]]
+) -> None:
+    """Make the association rows of every owner in ``targets`` match its ids with one bulk INSERT and chunked DELETEs.
+
+    Only the difference against the current rows is written, so the related objects are never loaded.
+    """
+    if not targets:
+        return
+    current: dict[UUID, set[UUID]] = {owner: set() for owner in targets}
+    stmt = select(association.local, association.remote).where(
+        association.local.in_(bindparam("owners", expanding=True))
+    )
+    for chunk in chunks(list(current)):
+        for owner, item_id in await session.execute(stmt, {"owners": chunk}):
+            current[owner].add(item_id)
+    await add_associations(session, association, {owner: set(ids) - current[owner] for owner, ids in targets.items()})
+    await remove_associations(
+        session, association, {owner: current[owner] - set(ids) for owner, ids in targets.items()}
+    )
+
+
+async def replace_association(
+    session: AsyncSession, association: Association, owner_id: UUID, ids: Collection[UUID]
+) -> None:
+    await replace_associations(session, association, {owner_id: ids})
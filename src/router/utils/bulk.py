@@ -0,0 +1,84 @@
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TypeVar
+from uuid import UUID
+
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+__all__ = (
+    "DEFAULT_BULK_CHUNK_SIZE",
+    "MAX_BULK_CHUNK_SIZE",
+    "BulkItemResult",
+    "BulkResult",
+    "run_bulk",
+)
+
+T = TypeVar("T")
+
+DEFAULT_BULK_CHUNK_SIZE = 500
+MAX_BULK_CHUNK_SIZE = 10000
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    """Position of the item in the request body."""
+    status: int
+    id: UUID | None = field(default=None)
+    detail: str | None = field(default=None)
+
+
+@dataclass
+class BulkResult:
+    items: list[BulkItemResult]
+    succeeded: int = field(default=0)
+    failed: int = field(default=0)
+
+
+Chunk = Sequence[tuple[int, T]]
+WriteChunk = Callable[[AsyncSession, Chunk[T]], Awaitable[list[BulkItemResult]]]
+ItemId = Callable[[T], UUID | None]
+
+
+def _failure(index: int, exc: Exception, id: UUID | None = None) -> BulkItemResult:
+    if isinstance(exc, ClientException):
+        return BulkItemResult(index=index, status=exc.status_code, id=id, detail=exc.detail)
+    if isinstance(exc, NoResultFound | StaleDataError):
+        return BulkItemResult(index=index, status=HTTP_404_NOT_FOUND, id=id, detail="No database result matching query")
+    return BulkItemResult(index=index, status=HTTP_409_CONFLICT, id=id, detail=str(getattr(exc, "orig", exc)))
+
+
+async def run_bulk(
+    session: AsyncSession,
+    items: Sequence[T],
+    chunk_size: int,
+    write: WriteChunk[T],
+    item_id: ItemId[T] | None = None,
+) -> BulkResult:
+    """Write ``items`` in chunks of ``chunk_size``, committing after every chunk.
+
+    Each chunk is first written as a whole inside a savepoint. If that fails, the savepoint is rolled back and the
+    chunk is retried one item per savepoint, so that a bad item only fails itself and the error is reported against
+    its index, and against the id ``item_id`` reads from it when the client supplied one.
+    """
+    results: list[BulkItemResult] = []
+    indexed = list(enumerate(items))
+    for start in range(0, len(indexed), chunk_size):
+        chunk = indexed[start : start + chunk_size]
+        try:
+            async with session.begin_nested():
+                results.extend(await write(session, chunk))
+        except (ClientException, IntegrityError, NoResultFound, StaleDataError):
+            for index, item in chunk:
+                try:
+                    async with session.begin_nested():
+                        results.extend(await write(session, [(index, item)]))
+                except (ClientException, IntegrityError, NoResultFound, StaleDataError) as exc:
+                    results.append(_failure(index, exc, item_id(item) if item_id else None))
+        await session.commit()
+    failed = sum(result.status >= 400 for result in results)
+    return BulkResult(items=results, succeeded=len(results) - failed, failed=failed)
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from litestar import Request
+from litestar.config.response_cache import default_cache_key_builder
+from litestar.stores.base import StorageObject, Store
+from sqlalchemy import TableClause
+
+from src.model.version import ALL_ROWS, STORED_ROW_VERSIONS, STORED_VERSIONS, table_versions
+
+__all__ = ("RESPONSE_CACHE_SIZE", "CacheStats", "LRUStore", "item_cache_key", "versioned_cache_key")
+
+# Entries of list pages and single items together, a few KiB each
+RESPONSE_CACHE_SIZE = 10000
+
+
+def versioned_cache_key(request: Request[Any, Any, Any], tables: Iterable[TableClause]) -> str:
+    """Key a response by method, path, sorted query parameters and the versions of ``tables``.
+
+    The versions are taken once per request, before the handler reads anything, and reused when the response is
+    stored. A write committed while the handler runs thus leaves the entry under versions that are already stale.
+    Versions read from the database at the start of the request take precedence over those of this process.
+    """
+    names = sorted(table.name for table in tables)
+    versions = request.state.get("table_versions")
+    if versions is None:
+        stored = request.state.get(STORED_VERSIONS)
+        snapshot = table_versions.snapshot(names) if stored is None else tuple(stored.get(name, 0) for name in names)
+        versions = request.state.table_versions = snapshot
+    return f"{default_cache_key_builder(request)}@{','.join(map(str, versions))}"
+
+
+def item_cache_key(
+    request: Request[Any, Any, Any], item_id: UUID, tables: Iterable[TableClause], read_tables: Iterable[TableClause]
+) -> str:
+    """Key a single item by method, path, sorted query parameters and the stored versions of its rows in ``tables``.
+
+    A write bumps only the versions of the items it changes, so the other cached items of the same tables stay valid.
+    Each table also has a version for writes whose rows are not known, which every item of the table is keyed by too.
+    Without stored row versions the item is keyed as a list is, by the versions of all of its ``read_tables``.
+    """
+    rows = request.state.get(STORED_ROW_VERSIONS)
+    if rows is None:
+        return versioned_cache_key(request, read_tables)
+    names = sorted(table.name for table in tables)
+    versions = (f"{rows.get((name, item_id), 0)}.{rows.get((name, ALL_ROWS), 0)}" for name in names)
+    return f"{default_cache_key_builder(request)}@{','.join(versions)}"
+
+
+@dataclass
+class CacheStats:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class LRUStore(Store):
+    """In-memory store that holds at most ``max_size`` values and evicts the least recently used first."""
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._store: OrderedDict[str, StorageObject] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._store[key] = StorageObject.new(data=value, expires_in=expires_in)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        storage_obj = self._store.get(key)
+        if storage_obj is None or storage_obj.expired:
+            self._store.pop(key, None)
+            self.misses += 1
+            return None
+        self._store.move_to_end(key)
+        self.hits += 1
+        return storage_obj.data
+
+    async def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    async def delete_all(self) -> None:
+        self._store.clear()
+
+    async def exists(self, key: str) -> bool:
+        return key in self._store
+
+    async def expires_in(self, key: str) -> int | None:
+        storage_obj = self._store.get(key)
+        return storage_obj.expires_in if storage_obj else None
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._store), max_size=self.max_size, hits=self.hits, misses=self.misses, evictions=self.evictions
+        )
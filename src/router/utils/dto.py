@@ -1,3 +1,5 @@
+from collections.abc import Hashable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from typing import Any, Generic, TypeVar
 
 from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO, SQLAlchemyDTOConfig
@@ -6,15 +8,52 @@ from litestar.exceptions import InvalidAnnotationException
 from litestar.typing import FieldDefinition
 from sqlalchemy.orm import DeclarativeBase
 
-__all__ = ("DTOGenerator",)
+__all__ = ("DTOGenerator", "get_dto")
 
 T = TypeVar("T", bound=DeclarativeBase)
 
+_registry: dict[tuple[type[Any], Hashable], type[AbstractDTO]] = {}
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, AbstractSet):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, Sequence) and not isinstance(value, str | bytes):
+        return tuple(_freeze(item) for item in value)
+    return value  # type: ignore[no-any-return]
+
+
+def get_dto(model_type: type[T], **config: Any) -> type[AbstractDTO]:
+    """Return the one ``SQLAlchemyDTO`` class for ``model_type`` and ``config``, creating it on first use.
+
+    Every DTO class repeats Litestar's field introspection and builds its own transfer models, so equal configurations
+    share a class for the lifetime of the process.
+    """
+    key = (model_type, _freeze(config))
+    if key not in _registry:
+        _registry[key] = type(
+            f"{model_type.__name__}DTO",
+            (SQLAlchemyDTO[model_type],),  # type: ignore[valid-type]
+            {"config": SQLAlchemyDTOConfig(**config)},
+        )
+    return _registry[key]
+
 
 class DTOGenerator(Generic[T]):
     model_type: type[T]
-    base_read_kwargs: dict[str, Any] = {"max_nested_depth": 0, "rename_strategy": "camel"}
-    base_write_kwargs: dict[str, Any] = {"max_nested_depth": 0, "partial": True, "rename_strategy": "camel"}
+    base_read_kwargs: dict[str, Any] = {
+        "max_nested_depth": 0,
+        "rename_strategy": "camel",
+        "experimental_codegen_backend": True,
+    }
+    base_write_kwargs: dict[str, Any] = {
+        "max_nested_depth": 0,
+        "partial": True,
+        "rename_strategy": "camel",
+        "experimental_codegen_backend": True,
+    }
 
     def __class_getitem__(cls, model_type: type[T]) -> type:
         field_definition = FieldDefinition.from_annotation(model_type)
@@ -53,14 +92,8 @@ class DTOGenerator(Generic[T]):
 
     @property
     def read_dto(self) -> type[AbstractDTO]:
-        class ReadDTO(SQLAlchemyDTO[self.model_type]):  # type: ignore[name-defined]
-            config = SQLAlchemyDTOConfig(**self.read_kwargs)
-
-        return ReadDTO
+        return get_dto(self.model_type, **self.read_kwargs)
 
     @property
     def write_dto(self) -> type[AbstractDTO]:
-        class WriteDTO(SQLAlchemyDTO[self.model_type]):  # type: ignore[name-defined]
-            config = SQLAlchemyDTOConfig(**self.write_kwargs)
-
-        return WriteDTO
+        return get_dto(self.model_type, **self.write_kwargs)
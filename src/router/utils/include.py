@@ -0,0 +1,90 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_400_BAD_REQUEST
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import MANYTOONE, RelationshipProperty, aliased
+
+from src.router.utils.query import to_camel
+from src.router.utils.struct import model_struct, to_struct
+
+__all__ = ("Include", "Loader", "load_included", "plan_includes")
+
+
+class Loader(str, Enum):
+    BY_ID = "by_id"
+    """Collect the foreign key values of the page and read the related rows by primary key."""
+    BY_OWNER = "by_owner"
+    """Join from the owners of the page to the related rows, like ``selectinload``."""
+
+
+@dataclass(frozen=True)
+class Include:
+    name: str
+    """Key of the related items in the ``included`` section."""
+    prop: RelationshipProperty[Any]
+    loader: Loader
+    foreign_key: str | None = None
+    """Column attribute of the owner holding the related id, for :attr:`Loader.BY_ID`."""
+
+
+def plan_includes(table: type[Any], include: str, loaders: Mapping[str, Loader] | None = None) -> list[Include]:
+    """Resolve an ``include`` parameter such as ``facility,samples`` to relationships of ``table`` and their loaders.
+
+    ``loaders`` fixes the loader of a relationship by its ORM attribute. Otherwise a many-to-one relationship with a
+    single foreign key column is read by id, which needs no join and is answered from the primary key of the related
+    table, and everything else is read through a join from the owners on the page.
+    """
+    mapper = inspect(table)
+    names = {to_camel(prop.key): prop for prop in mapper.relationships}
+    plan = []
+    for name in dict.fromkeys(filter(None, (name.strip() for name in include.split(",")))):
+        prop = names.get(name) or names.get(to_camel(name))
+        if prop is None:
+            raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail=f"Unknown relationship '{name}'")
+        by_id = prop.direction is MANYTOONE and prop.secondary is None and len(prop.local_columns) == 1
+        loader = (loaders or {}).get(prop.key, Loader.BY_ID if by_id else Loader.BY_OWNER)
+        if loader is Loader.BY_ID and not by_id:
+            raise ValueError(f"{table.__name__}.{prop.key} cannot be read by id")
+        if loader is Loader.BY_ID:
+            (column,) = prop.local_columns
+            plan.append(Include(to_camel(prop.key), prop, loader, mapper.get_property_by_column(column).key))
+        else:
+            plan.append(Include(to_camel(prop.key), prop, loader))
+    return plan
+
+
+async def load_included(
+    session: AsyncSession, table: type[Any], plan: Sequence[Include], items: Sequence[Any]
+) -> dict[str, list[Any]]:
+    """Read the related items of every ``items`` owner with one query per relationship in ``plan``.
+
+    ``items`` may be instances or plain rows. Related items are deduplicated, so one shared by the whole page is read
+    and encoded once.
+    """
+    included: dict[str, list[Any]] = {}
+    owner_ids = [item.id for item in items]
+    for entry in plan:
+        target = entry.prop.mapper.class_
+        struct = model_struct(target)
+        if not owner_ids:
+            included[entry.name] = []
+            continue
+        if entry.loader is Loader.BY_ID and all(hasattr(item, entry.foreign_key) for item in items):  # type: ignore[arg-type]
+            ids = {getattr(item, entry.foreign_key) for item in items} - {None}  # type: ignore[arg-type]
+            stmt = select(target).where(target.id.in_(ids))
+        else:
+            # Aliased so that self-referential relationships such as ObservationUnit.parents join unambiguously
+            related = aliased(target)
+            stmt = (
+                select(related)
+                .join_from(table, getattr(table, entry.prop.key).of_type(related))
+                .where(table.id.in_(owner_ids))
+                .distinct()
+            )
+        included[entry.name] = [to_struct(struct, row) for row in await session.scalars(stmt)]
+    return included
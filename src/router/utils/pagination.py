@@ -0,0 +1,150 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, Literal, TypeVar
+
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_400_BAD_REQUEST
+from sqlalchemy import ColumnElement, Select, and_, false, or_, tuple_
+
+from src.router.utils.query import SortKey, coerce_value
+
+__all__ = (
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "Cursor",
+    "CursorPage",
+    "after_cursor",
+    "decode_cursor",
+    "encode_cursor",
+    "order_by_keys",
+    "paginate",
+    "to_page",
+)
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+Direction = Literal["next", "prev"]
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    items: list[T]
+    limit: int
+    next: str | None = field(default=None)
+    prev: str | None = field(default=None)
+    included: dict[str, list[Any]] = field(default_factory=dict)
+    """Related items asked for with ``?include=``, by relationship name."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    direction: Direction
+    values: tuple[Any, ...]
+
+
+def _signature(keys: list[SortKey]) -> str:
+    return ",".join(f"-{key.name}" if key.descending else key.name for key in keys)
+
+
+def _encode_value(value: Any) -> Any:
+    if value is None or isinstance(value, int | float | str):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(item: Any, direction: Direction, keys: list[SortKey]) -> str:
+    payload = {
+        "d": direction,
+        "s": _signature(keys),
+        "k": [_encode_value(getattr(item, key.name)) for key in keys],
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, keys: list[SortKey]) -> Cursor:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        direction, signature, values = payload["d"], payload["s"], payload["k"]
+        if direction not in ("next", "prev") or len(values) != len(keys):
+            raise ValueError(direction)
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+        raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor") from exc
+    if signature != _signature(keys):
+        raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail="Pagination cursor does not match sort order")
+    return Cursor(
+        direction=direction,
+        values=tuple(
+            None if value is None else coerce_value(key.attribute, str(value))
+            for key, value in zip(keys, values, strict=True)
+        ),
+    )
+
+
+def _strictly_after(key: SortKey, value: Any, descending: bool) -> ColumnElement[bool]:
+    # SQLite sorts NULL first in ascending and last in descending order.
+    attribute = key.attribute
+    after: ColumnElement[bool]
+    if not descending:
+        after = attribute.is_not(None) if value is None else attribute > value
+    elif value is None:
+        after = false()
+    else:
+        after = or_(attribute < value, attribute.is_(None)) if key.nullable else attribute < value
+    return after
+
+
+def _after(keys: list[SortKey], values: tuple[Any, ...], reverse: bool) -> ColumnElement[bool]:
+    directions = [key.descending != reverse for key in keys]
+    if len(set(directions)) == 1 and not any(key.nullable for key in keys):
+        row = tuple_(*(key.attribute for key in keys))
+        return row < values if directions[0] else row > values
+    clauses = []
+    for index, key in enumerate(keys):
+        equal = [
+            prior.attribute.is_(None) if value is None else prior.attribute == value
+            for prior, value in zip(keys[:index], values[:index], strict=True)
+        ]
+        clauses.append(and_(*equal, _strictly_after(key, values[index], directions[index])))
+    return or_(*clauses)
+
+
+def after_cursor(keys: list[SortKey], cursor: Cursor) -> ColumnElement[bool]:
+    """Select the rows past ``cursor`` in the direction it points, in ``keys`` order."""
+    return _after(keys, cursor.values, cursor.direction == "prev")
+
+
+def order_by_keys(stmt: Select, keys: list[SortKey], reverse: bool = False) -> Select:
+    return stmt.order_by(*(key.attribute.desc() if key.descending != reverse else key.attribute.asc() for key in keys))
+
+
+def paginate(stmt: Select, keys: list[SortKey], limit: int, cursor: Cursor | None = None) -> Select:
+    """Restrict ``stmt`` to the page following (or preceding) ``cursor`` in ``keys`` order.
+
+    One extra row is fetched so that :func:`to_page` can tell whether another page follows.
+    """
+    reverse = cursor is not None and cursor.direction == "prev"
+    if cursor is not None:
+        stmt = stmt.where(after_cursor(keys, cursor))
+    return order_by_keys(stmt, keys, reverse).limit(limit + 1)
+
+
+def to_page(rows: list[Any], limit: int, keys: list[SortKey], cursor: Cursor | None = None) -> CursorPage[Any]:
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    backward = cursor is not None and cursor.direction == "prev"
+    if backward:
+        rows.reverse()
+    page = CursorPage(items=rows, limit=limit)
+    if rows:
+        if backward or has_more:
+            page.next = encode_cursor(rows[-1], "next", keys)
+        if (backward and has_more) or (not backward and cursor is not None):
+            page.prev = encode_cursor(rows[0], "prev", keys)
+    return page
@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, ParamSpec, TypeVar, cast
+
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_400_BAD_REQUEST
+from sqlalchemy import ColumnElement, and_, inspect, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.model.index import is_indexed
+
+__all__ = (
+    "FILTER_OPERATORS",
+    "IN_CHUNK_SIZE",
+    "MEMOIZE_SIZE",
+    "SortKey",
+    "chunks",
+    "coerce_value",
+    "compile_filters",
+    "compile_sort",
+    "memoize",
+    "resolve_attribute",
+    "to_camel",
+)
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+# Highest code point, used as the exclusive upper bound of an index-friendly prefix range.
+PREFIX_UPPER_BOUND = "\U0010ffff"
+# Values bound to one IN list, well below SQLite's limit on variables per statement.
+IN_CHUNK_SIZE = 500
+# Results kept by each memoized function. Some keys come from query parameters, such as a ``?fields=`` subset, so the
+# cache is bounded rather than growing with every combination a client sends.
+MEMOIZE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class SortKey:
+    attribute: InstrumentedAttribute[Any]
+    descending: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.attribute.key
+
+    @property
+    def nullable(self) -> bool:
+        return bool(self.attribute.property.columns[0].nullable)
+
+
+def memoize(function: Callable[P, T]) -> Callable[P, T]:
+    """:func:`functools.lru_cache` of ``MEMOIZE_SIZE`` results that keeps the signature of ``function``.
+
+    Calls are then checked against the signature of ``function`` rather than the cache wrapper.
+    """
+    return cast("Callable[P, T]", lru_cache(maxsize=MEMOIZE_SIZE)(function))
+
+
+def chunks(values: Sequence[T], size: int = IN_CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def to_camel(name: str) -> str:
+    head, *tail = name.split("_")
+    return head + "".join(word.title() for word in tail)
+
+
+def _bad_request(detail: str) -> ClientException:
+    return ClientException(status_code=HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def resolve_attribute(table: type[Any], name: str) -> InstrumentedAttribute[Any]:
+    """Find the mapped column of ``table`` named ``name`` in either snake_case or camelCase."""
+    for attr in inspect(table).column_attrs:
+        if name in (attr.key, to_camel(attr.key)):
+            return getattr(table, attr.key)  # type: ignore[no-any-return]
+    raise _bad_request(f"Unknown field '{name}' for {table.__name__}")
+
+
+def coerce_value(attribute: InstrumentedAttribute[Any], value: str) -> Any:
+    column = attribute.property.columns[0]
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime:
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None and getattr(column.type, "timezone", False):
+                parsed = parsed.replace(tzinfo=UTC)
+            return parsed
+        if python_type is bool:
+            return value.lower() in ("true", "1")
+        return python_type(value)
+    except (TypeError, ValueError) as exc:
+        raise _bad_request(f"Invalid value '{value}' for field '{to_camel(attribute.key)}'") from exc
+
+
+def _coerce_list(attribute: InstrumentedAttribute[Any], value: str) -> list[Any]:
+    return [coerce_value(attribute, item) for item in value.split(",")]
+
+
+def _between(attribute: InstrumentedAttribute[Any], value: str) -> ColumnElement[bool]:
+    bounds = _coerce_list(attribute, value)
+    if len(bounds) != 2:
+        raise _bad_request(f"'between' on '{to_camel(attribute.key)}' takes exactly two values")
+    return attribute.between(*bounds)
+
+
+def _prefix(attribute: InstrumentedAttribute[Any], value: str) -> ColumnElement[bool]:
+    # A range rather than LIKE so that SQLite can answer it from an index on the column.
+    return and_(attribute >= value, attribute < value + PREFIX_UPPER_BOUND)
+
+
+def _is_null(attribute: InstrumentedAttribute[Any], value: str) -> ColumnElement[bool]:
+    if value.lower() in ("", "true", "1"):
+        return attribute.is_(None)
+    return attribute.is_not(None)
+
+
+FILTER_OPERATORS: dict[str, Callable[[InstrumentedAttribute[Any], str], ColumnElement[bool]]] = {
+    "eq": lambda attr, value: attr == coerce_value(attr, value),
+    "ne": lambda attr, value: attr != coerce_value(attr, value),
+    "lt": lambda attr, value: attr < coerce_value(attr, value),
+    "le": lambda attr, value: attr <= coerce_value(attr, value),
+    "gt": lambda attr, value: attr > coerce_value(attr, value),
+    "ge": lambda attr, value: attr >= coerce_value(attr, value),
+    "in": lambda attr, value: attr.in_(_coerce_list(attr, value)),
+    "between": _between,
+    "prefix": _prefix,
+    "isnull": _is_null,
+}
+
+
+def _compile_condition(table: type[Any], condition: str) -> ColumnElement[bool]:
+    name, _, rest = condition.partition(":")
+    op, _, value = rest.partition(":")
+    if op not in FILTER_OPERATORS:
+        raise _bad_request(f"Unknown filter operator '{op}' in '{condition}'")
+    return FILTER_OPERATORS[op](resolve_attribute(table, name), value)
+
+
+def compile_filters(table: type[Any], filters: list[str] | None) -> list[ColumnElement[bool]]:
+    """Compile ``field:op:value`` filter expressions into where clauses.
+
+    Separate expressions are combined with AND; alternatives inside one expression are separated by ``|`` and
+    combined with OR, e.g. ``title:prefix:Plot|title:eq:894``.
+    """
+    clauses = []
+    for expression in filters or []:
+        alternatives = [_compile_condition(table, condition) for condition in expression.split("|")]
+        clauses.append(alternatives[0] if len(alternatives) == 1 else or_(*alternatives))
+    return clauses
+
+
+def compile_sort(table: type[Any], sort: str | None) -> list[SortKey]:
+    """Parse a ``sort`` parameter such as ``-createdAt,title`` into keys ending with the ``id`` tiebreaker.
+
+    Only indexed columns are accepted so that a sort can never turn a page read into a full table scan.
+    """
+    if not sort:
+        return [SortKey(table.created_at), SortKey(table.id)]
+    keys = []
+    for name in sort.split(","):
+        descending = name.startswith("-")
+        attribute = resolve_attribute(table, name.lstrip("+-"))
+        if not is_indexed(attribute.property.columns[0]):
+            raise _bad_request(f"Cannot sort on '{to_camel(attribute.key)}': column is not indexed")
+        keys.append(SortKey(attribute, descending))
+    if all(key.name != "id" for key in keys):
+        keys.append(SortKey(table.id, keys[-1].descending))
+    return keys
@@ -0,0 +1,60 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from typing import Any, Literal
+
+import msgspec
+from litestar.enums import MediaType
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncResult, AsyncScalarResult, AsyncSession
+
+__all__ = (
+    "STREAM_MEDIA_TYPE",
+    "STREAM_YIELD_PER",
+    "StreamFormat",
+    "stream_rows",
+)
+
+STREAM_YIELD_PER = 1000
+
+StreamFormat = Literal["ndjson", "json"]
+STREAM_MEDIA_TYPE: dict[StreamFormat, str] = {"ndjson": "application/x-ndjson", "json": MediaType.JSON}
+
+
+async def stream_rows(
+    engine: AsyncEngine,
+    stmt: Select,
+    serialise: Callable[[Any], Any] | None = None,
+    format: StreamFormat = "ndjson",
+    load: Callable[[AsyncSession, Sequence[Any]], Awaitable[Sequence[Any]]] | None = None,
+    rows: bool = False,
+) -> AsyncGenerator[bytes, None]:
+    """Encode the rows of ``stmt`` as NDJSON lines or a chunked JSON array while they come off the cursor.
+
+    The request session is closed before a streamed body is sent, so the rows are read through a session of their own.
+    ``load`` may replace each partition of rows, e.g. to fetch what they reference in one query per partition, and
+    ``serialise`` converts each row into something msgspec can encode. With ``rows`` the statement selects columns
+    rather than an entity and plain ``Row`` objects are streamed.
+    """
+    encoder = msgspec.json.Encoder()
+    separator = b"\n" if format == "ndjson" else b","
+    async with AsyncSession(engine) as session:
+        stmt = stmt.execution_options(yield_per=STREAM_YIELD_PER)
+        result: AsyncResult[Any] | AsyncScalarResult[Any]
+        if rows:
+            result = await session.stream(stmt)
+        else:
+            result = await session.stream_scalars(stmt)
+        if format == "json":
+            yield b"["
+        leading = b""
+        async for partition in result.partitions():
+            if load is not None:
+                partition = await load(session, partition)
+            if serialise is not None:
+                partition = [serialise(item) for item in partition]
+            chunk = separator.join(encoder.encode(item) for item in partition)
+            yield leading + chunk
+            leading = separator
+        if format == "ndjson" and leading:
+            yield b"\n"
+        if format == "json":
+            yield b"]"
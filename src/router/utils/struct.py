@@ -0,0 +1,81 @@
+from dataclasses import MISSING, fields
+from typing import Any, get_type_hints
+
+import msgspec
+from litestar.dto.field import DTO_FIELD_META_KEY, Mark
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_400_BAD_REQUEST
+from sqlalchemy import inspect
+
+from src.router.utils.query import memoize, to_camel
+
+__all__ = ("dataclass_struct", "model_struct", "parse_fields", "partial_struct", "struct_columns", "to_struct")
+
+
+@memoize
+def model_struct(table: type[Any]) -> type[msgspec.Struct]:
+    """Build a ``Struct`` with the column attributes of ``table``, encoding to the same JSON as its read DTO."""
+    struct_fields: list[tuple[str, Any]] = []
+    for attr in inspect(table).column_attrs:
+        column = attr.columns[0]
+        dto_field = column.info.get(DTO_FIELD_META_KEY)
+        if dto_field is not None and dto_field.mark == Mark.PRIVATE:
+            continue
+        try:
+            python_type: Any = column.type.python_type
+        except NotImplementedError:
+            python_type = Any
+        struct_fields.append((attr.key, python_type | None if column.nullable else python_type))
+    return msgspec.defstruct(f"{table.__name__}Struct", struct_fields, rename="camel", kw_only=True)
+
+
+@memoize
+def dataclass_struct(dataclass: type[Any]) -> type[msgspec.Struct]:
+    """Build a ``Struct`` with the fields and defaults of ``dataclass``."""
+    hints = get_type_hints(dataclass)
+    struct_fields: list[tuple[str, Any] | tuple[str, Any, Any]] = []
+    for field in fields(dataclass):
+        if field.default_factory is not MISSING:
+            struct_fields.append((field.name, hints[field.name], msgspec.field(default_factory=field.default_factory)))
+        elif field.default is not MISSING:
+            struct_fields.append((field.name, hints[field.name], field.default))
+        else:
+            struct_fields.append((field.name, hints[field.name]))
+    name = dataclass.__name__.removesuffix("Dataclass")
+    return msgspec.defstruct(f"{name}Struct", struct_fields, rename="camel", kw_only=True)
+
+
+def parse_fields(struct: type[msgspec.Struct], fields: str) -> frozenset[str]:
+    """Resolve a ``fields`` parameter such as ``title,studyId`` to field names of ``struct``; ``id`` is always kept."""
+    names = {to_camel(name): name for name in struct.__struct_fields__}
+    selected = {"id"}
+    for name in filter(None, (name.strip() for name in fields.split(","))):
+        if name not in names and name not in names.values():
+            raise ClientException(status_code=HTTP_400_BAD_REQUEST, detail=f"Unknown field '{name}'")
+        selected.add(names.get(name, name))
+    return frozenset(selected)
+
+
+@memoize
+def partial_struct(struct: type[msgspec.Struct], names: frozenset[str]) -> type[msgspec.Struct]:
+    """Build a ``Struct`` with only the fields of ``struct`` in ``names``, in their original order."""
+    struct_fields: list[tuple[str, Any, Any]] = []
+    for field in msgspec.structs.fields(struct):
+        if field.name not in names:
+            continue
+        if field.default_factory is not msgspec.NODEFAULT:
+            struct_fields.append((field.name, field.type, msgspec.field(default_factory=field.default_factory)))
+        else:
+            struct_fields.append((field.name, field.type, field.default))
+    return msgspec.defstruct(f"Partial{struct.__name__}", struct_fields, rename="camel", kw_only=True)
+
+
+@memoize
+def struct_columns(table: type[Any], struct: type[msgspec.Struct]) -> tuple[str, ...]:
+    """The column attributes of ``table`` that ``struct`` has a field for."""
+    return tuple(attr.key for attr in inspect(table).column_attrs if attr.key in struct.__struct_fields__)
+
+
+def to_struct(struct: type[msgspec.Struct], item: Any) -> Any:
+    """Copy the attributes of ``item`` into ``struct`` without building an intermediate dict."""
+    return msgspec.convert(item, struct, from_attributes=True)
@@ -1,14 +1,17 @@
-from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
-from litestar import get
+from litestar import Request, get
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from src.router.base import S
+
 from src.model import Vocabulary
-from src.router.base import BaseController, read_items_by_attrs
+from src.router.base import FIELDS, FILTERS, INCLUDE, PAGE_LIMIT, BaseController
 from src.router.utils.dto import DTOGenerator
+from src.router.utils.pagination import DEFAULT_PAGE_SIZE, CursorPage
 
 __all__ = ("VocabularyController",)
 
@@ -18,22 +21,42 @@ VocabularyDTO = DTOGenerator[Vocabulary]()
 
 class VocabularyController(BaseController[Vocabulary]):
     path = "/vocabulary"
+    cache_lists = True
+    cache_items = True
     dto = VocabularyDTO.read_dto
     return_dto = VocabularyDTO.write_dto
 
-    @get(return_dto=VocabularyDTO.read_dto)
+    @get(return_dto=None)
     async def get_items(
         self,
-        transaction: "AsyncSession",
         table: Any,
+        read_session: "AsyncSession",
+        request: Request[Any, Any, Any],
         title: str | None = None,
         namespace: str | None = None,
         external_reference: str | None = None,
-    ) -> Sequence[Vocabulary]:
-        return await read_items_by_attrs(
-            session=transaction,
-            table=table,
+        id: UUID | list[UUID] | None = None,
+        limit: PAGE_LIMIT = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        sort: str | None = None,
+        filters: FILTERS = None,
+        fields: FIELDS = None,
+        include: INCLUDE = None,
+    ) -> "CursorPage[S]":
+        # The base list handler, with the namespace and external reference added as query parameters
+        return await BaseController.get_items.fn(  # type: ignore[no-any-return]
+            self,
+            table,
+            read_session,
+            request,
+            title,
+            id=id,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            filters=filters,
+            fields=fields,
+            include=include,
             namespace=namespace,
             external_reference=external_reference,
-            title=title,
         )
@@ -6,11 +6,12 @@ from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
 from litestar import Litestar
 from litestar.testing import AsyncTestClient
 
-from src.helpers import create_db_config, provide_transaction
+from src.helpers import SQLiteReaderPlugin, create_db_config, provide_transaction
 from src.router import (
     BiologicalMaterialController,
     DataFileController,
     DeviceController,
+    DiagnosticsController,
     EnvironmentController,
     EventController,
     ExperimentalFactorController,
@@ -27,6 +28,7 @@ from src.router import (
     UnitController,
     VocabularyController,
 )
+from src.router.utils.cache import LRUStore
 
 pytest_plugins = [
     "tests.router.investigation.fixture",
@@ -73,10 +75,13 @@ async def test_client() -> AsyncGenerator[AsyncTestClient[Litestar], None]:
             ObservationUnitController,
             EventController,
             SampleController,
+            DiagnosticsController,
         ],
         dependencies={"transaction": provide_transaction},
-        plugins=[SQLAlchemyPlugin(db_config)],
+        plugins=[SQLAlchemyPlugin(db_config), SQLiteReaderPlugin("test.sqlite")],
+        stores={"response_cache": LRUStore()},
     )
     async with AsyncTestClient(app=app) as client:
         yield client
-    p.unlink(missing_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        p.with_name(p.name + suffix).unlink(missing_ok=True)
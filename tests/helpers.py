@@ -1,13 +1,31 @@
 import datetime
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Literal
 from uuid import UUID
 
 from httpx import Response
 from litestar.testing import AsyncTestClient
+from sqlalchemy import Engine, event
 
 from src.model.base import Serialisable
 
 
+@contextmanager
+def captured_statements() -> Iterator[list[str]]:
+    """Collect the SQL of every statement executed on any engine while the block runs."""
+    statements: list[str] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", capture)
+
+
 def serialise_datetime(obj: Any) -> str:
     if isinstance(obj, datetime.datetime):
         return obj.strftime("%Y-%m-%d")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, create_engine
+from sqlalchemy.schema import CreateTable
+
+from src.model import Base
+from src.model.index import index_foreign_keys, is_association_table, unindexed_relationship_columns
+
+
+def test_every_relationship_join_is_index_backed() -> None:
+    assert unindexed_relationship_columns(Base.registry) == []
+
+
+def test_association_tables_index_both_sides() -> None:
+    association_tables = [table for table in Base.metadata.tables.values() if is_association_table(table)]
+    assert association_tables
+    for table in association_tables:
+        _, reverse = table.primary_key.columns
+        assert any(next(iter(index.columns)) is reverse for index in table.indexes)
+        assert table.dialect_options["sqlite"]["with_rowid"] is True
+
+
+def test_association_tables_without_rowid_on_request() -> None:
+    metadata = MetaData()
+    Table("left", metadata, Column("id", Integer, primary_key=True))
+    Table("right", metadata, Column("id", Integer, primary_key=True))
+    link = Table(
+        "left_to_right",
+        metadata,
+        Column("left_id", ForeignKey("left.id"), primary_key=True),
+        Column("right_id", ForeignKey("right.id"), primary_key=True),
+    )
+    index_foreign_keys(metadata, without_rowid=True)
+    assert link.dialect_options["sqlite"]["with_rowid"] is False
+    assert "WITHOUT ROWID" in str(CreateTable(link).compile(create_engine("sqlite://")))
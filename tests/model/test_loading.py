@@ -0,0 +1,6 @@
+from src.model import Base
+from src.model.loading import implicitly_loaded_relationships
+
+
+def test_every_relationship_raises_on_implicit_load() -> None:
+    assert implicitly_loaded_relationships(Base.registry) == []
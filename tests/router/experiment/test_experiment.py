@@ -1,3 +1,4 @@
+import json
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -65,3 +66,21 @@ async def test_barley_file_updated(
 ) -> None:
     fixture = get_experiment_fixture(update_experiment.maize, MAIZE_EXPERIMENT)
     await validate_put(PATH, fixture.data, test_client, fixture.response)
+
+
+async def test_experiments_sparse_fieldset(
+    setup_experiment: AllExperimentFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    page = (await test_client.get(PATH, params={"fields": "title,studyId", "limit": 1})).json()
+    (item,) = page["items"]
+    assert set(item) == {"id", "title", "studyId"}
+    assert page["next"] is not None
+
+    response = await test_client.get(f"{PATH}/{item['id']}", params={"fields": "title"})
+    assert response.json() == {"id": item["id"], "title": item["title"]}
+
+    response = await test_client.get(f"{PATH}/stream", params={"fields": "descriptionOfExperimentalDesign"})
+    expected = {"id", "descriptionOfExperimentalDesign"}
+    assert all(set(json.loads(line)) == expected for line in response.text.splitlines())
+
+    assert (await test_client.get(PATH, params={"fields": "title,unknown"})).status_code == 400
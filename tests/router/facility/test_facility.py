@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from httpx import Response
 from litestar.testing import AsyncTestClient
@@ -50,3 +50,39 @@ async def test_facility_created(setup_facility: AllFacilityFixtureResponse, test
 async def test_update_facility(update_facility: AllFacilityFixtureResponse, test_client: AsyncTestClient) -> None:
     fixture = get_facility_fixture(update_facility.inrae_field, INRAE_FIELD)
     await validate_put(PATH, fixture.data, test_client, fixture.response)
+
+
+async def test_facility_patched(setup_facility: AllFacilityFixtureResponse, test_client: AsyncTestClient) -> None:
+    fixture = get_facility_fixture(setup_facility.appn_greenhouse, APPN_GREENHOUSE)
+    before = fixture.response.json()
+
+    response = await test_client.patch(f"{PATH}/{fixture.id}", json={"address": None, "name": "Greenhouse"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Greenhouse"
+    assert data["address"] is None
+    assert data["description"] == before["description"]
+    assert data["createdAt"] == before["createdAt"]
+    assert data["updatedAt"] > before["updatedAt"]
+
+    response = await test_client.patch(f"{PATH}/{uuid4()}", json={"name": "Greenhouse"})
+    assert response.status_code == 404
+
+
+async def test_facilities_bulk(test_client: AsyncTestClient) -> None:
+    response = await test_client.post(f"{PATH}/bulk", json=[{"name": "Bulk A"}, {"name": "Bulk B", "city": "Adelaide"}])
+    assert response.status_code == 200
+    ids = [item["id"] for item in response.json()["items"]]
+    assert [item["status"] for item in response.json()["items"]] == [201, 201]
+
+    items = [{"id": ids[0], "city": "Perth"}, {"id": ids[1], "city": None}]
+    response = await test_client.patch(f"{PATH}/bulk", json=items)
+    assert [item["status"] for item in response.json()["items"]] == [200, 200]
+    assert (await test_client.get(f"{PATH}/{ids[0]}")).json()["city"] == "Perth"
+    assert (await test_client.get(f"{PATH}/{ids[1]}")).json()["city"] is None
+
+    response = await test_client.patch(f"{PATH}/bulk", json=[{"id": ids[0], "latitude": 1}, {"city": "Perth"}])
+    assert [item["status"] for item in response.json()["items"]] == [400, 400]
+
+    response = await test_client.request("DELETE", f"{PATH}/bulk", json=ids)
+    assert [item["status"] for item in response.json()["items"]] == [200, 200]
@@ -50,3 +50,25 @@ async def test_methods_created(setup_method: AllMethodFixtureResponse, test_clie
 
     fixture = get_method_fixture(setup_method.zn_concentration, ZN_CONCENTRATION_METHOD)
     await validate_post(PATH, fixture.data, test_client, fixture.response)
+
+
+async def test_method_and_vocabulary_merge_patched(
+    setup_method: AllMethodFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    fixture = get_method_fixture(setup_method.projected_shoot_area, PROJECTED_SHOOT_AREA_METHOD)
+    before = (await test_client.get(f"{PATH}/{fixture.id}")).json()
+    response = await test_client.patch(f"{PATH}/{fixture.id}", json={"description": "Patched"})
+    assert response.status_code == 200
+    assert (await test_client.get(f"{PATH}/{fixture.id}")).json() == {
+        **before,
+        "description": "Patched",
+        "updatedAt": response.json()["updatedAt"],
+    }
+
+    vocabulary = f"vocabulary/{fixture.method_reference_id}"
+    before = (await test_client.get(vocabulary)).json()
+    response = await test_client.patch(vocabulary, json={"title": "Patched"})
+    assert response.status_code == 200
+    after = (await test_client.get(vocabulary)).json()
+    assert after == {**before, "title": "Patched", "updatedAt": after["updatedAt"]}
+    assert after["externalReference"] is not None
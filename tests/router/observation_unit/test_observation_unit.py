@@ -1,11 +1,13 @@
+import json
 from dataclasses import dataclass
-from uuid import UUID
+from typing import Any
+from uuid import UUID, uuid4
 
 from httpx import Response
 from litestar.testing import AsyncTestClient
 
 from src.model.observation_unit import ObservationUnit, ObservationUnitDataclass
-from tests.helpers import validate_post, validate_put
+from tests.helpers import captured_statements, validate_post, validate_put
 from tests.router.observation_unit.fixture import (
     PATH,
     PLANT_061439,
@@ -82,3 +84,265 @@ async def test_observation_unit_updated(
 ) -> None:
     fixture = get_observation_unit_fixture(update_observation_unit.plot_894, PLOT_894)
     await validate_put(PATH, fixture.data, test_client, fixture.response)
+
+
+async def test_observation_units_paginated(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    first = (await test_client.get(PATH, params={"limit": 2})).json()
+    assert len(first["items"]) == 2
+    assert first["prev"] is None
+    assert first["next"] is not None
+
+    second = (await test_client.get(PATH, params={"limit": 2, "cursor": first["next"]})).json()
+    assert len(second["items"]) == 1
+    assert second["next"] is None
+    assert second["items"][0]["title"] == PLANT_061440.title
+
+    previous = (await test_client.get(PATH, params={"limit": 2, "cursor": second["prev"]})).json()
+    assert [item["id"] for item in previous["items"]] == [item["id"] for item in first["items"]]
+    assert previous["prev"] is None
+
+
+async def test_observation_units_invalid_page_request(test_client: AsyncTestClient) -> None:
+    assert (await test_client.get(PATH, params={"cursor": "not-a-cursor"})).status_code == 400
+    assert (await test_client.get(PATH, params={"limit": 100_000})).status_code == 400
+
+
+async def test_observation_units_streamed(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    response = await test_client.get(f"{PATH}/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == [PLOT_894.title, PLANT_061439.title, PLANT_061440.title]
+    plot = get_observation_unit_fixture(setup_observation_units.plot_894, PLOT_894)
+    assert set(lines[0]["studyId"]) == set(plot.study_id)
+    plant = get_observation_unit_fixture(setup_observation_units.plant_061439, PLANT_061439)
+    assert lines[1]["parentId"] == plant.parent_id
+    assert set(lines[1]["experimentalFactorId"]) == set(plant.experimental_factor_id)
+
+    response = await test_client.get(f"{PATH}/stream", params={"format": "json"})
+    assert [item["id"] for item in response.json()] == [line["id"] for line in lines]
+
+
+async def test_observation_units_filtered_and_sorted(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    response = await test_client.get(PATH, params={"filter": "title:prefix:0614"})
+    assert len(response.json()["items"]) == 2
+
+    response = await test_client.get(PATH, params={"filter": ["title:prefix:0614", "location:prefix:smarthouse"]})
+    assert len(response.json()["items"]) == 2
+
+    response = await test_client.get(PATH, params={"filter": "title:eq:894|location:isnull"})
+    assert [item["title"] for item in response.json()["items"]] == [PLOT_894.title]
+
+    first = (await test_client.get(PATH, params={"sort": "-createdAt", "limit": 2})).json()
+    second = (await test_client.get(PATH, params={"sort": "-createdAt", "limit": 2, "cursor": first["next"]})).json()
+    assert [item["title"] for item in second["items"]] == [PLOT_894.title]
+
+
+async def test_observation_units_invalid_query(test_client: AsyncTestClient) -> None:
+    assert (await test_client.get(PATH, params={"filter": "unknown:eq:1"})).status_code == 400
+    assert (await test_client.get(PATH, params={"filter": "title:like:1"})).status_code == 400
+    assert (await test_client.get(PATH, params={"filter": "createdAt:gt:yesterday"})).status_code == 400
+    assert (await test_client.get(PATH, params={"sort": "location"})).status_code == 400
+
+
+async def test_observation_units_filtered_by_reference(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    maize_id = setup_observation_units.study_response.maize.study_response.json()["id"]
+    barley_id = setup_observation_units.study_response.barley.study_response.json()["id"]
+    greenhouse_id = setup_observation_units.facility_response.appn_greenhouse.facility_response.json()["id"]
+
+    response = await test_client.get(PATH, params={"studyId": maize_id})
+    assert [item["title"] for item in response.json()["items"]] == [PLOT_894.title]
+
+    response = await test_client.get(PATH, params={"studyId": [maize_id, barley_id]})
+    assert len(response.json()["items"]) == 3
+
+    response = await test_client.get(PATH, params={"studyId": maize_id, "facilityId": greenhouse_id})
+    assert response.json()["items"] == []
+
+    response = await test_client.get(PATH, params={"facilityId": greenhouse_id})
+    assert len(response.json()["items"]) == 2
+
+    assert (await test_client.get(PATH, params={"studyId": "not-a-uuid"})).status_code == 400
+
+
+async def test_observation_units_paginated_on_nullable_key(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    await test_client.post(PATH, json={"title": "no facility"})
+    seen: list[str] = []
+    params: dict[str, str | int] = {"sort": "-facilityId", "limit": 1}
+    while True:
+        page = (await test_client.get(PATH, params=params)).json()
+        seen.extend(item["id"] for item in page["items"])
+        if page["next"] is None:
+            break
+        params["cursor"] = page["next"]
+    assert len(seen) == len(set(seen)) == 4
+
+
+async def test_observation_unit_members_updated(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    plot = get_observation_unit_fixture(setup_observation_units.plot_894, PLOT_894)
+    maize_id = setup_observation_units.study_response.maize.study_response.json()["id"]
+    first_id = setup_observation_units.study_response.first.study_response.json()["id"]
+
+    response = await test_client.patch(f"{PATH}/{plot.id}/studies", json={"add": [first_id], "remove": [maize_id]})
+    assert response.status_code == 200
+    assert set(response.json()["studyId"]) == set(plot.study_id) - {maize_id} | {first_id}
+
+    response = await test_client.put(f"{PATH}/{plot.id}", json={"title": PLOT_894.title, "studyId": [maize_id]})
+    assert response.status_code == 200
+    assert response.json()["studyId"] == [maize_id]
+
+    # More ids than fit one IN list
+    remove = [*(str(uuid4()) for _ in range(1500)), maize_id]
+    response = await test_client.patch(f"{PATH}/{plot.id}/studies", json={"remove": remove})
+    assert response.status_code == 200
+    assert response.json()["studyId"] == []
+
+    response = await test_client.patch(f"{PATH}/{plot.id}/samples", json={"add": [first_id]})
+    assert response.status_code == 404
+
+
+async def test_observation_unit_patched(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    plot = get_observation_unit_fixture(setup_observation_units.plot_894, PLOT_894)
+    maize_id = setup_observation_units.study_response.maize.study_response.json()["id"]
+
+    response = await test_client.patch(f"{PATH}/{plot.id}", json={"location": "Bay 4", "facilityId": None})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == PLOT_894.title
+    assert data["location"] == "Bay 4"
+    assert data["facilityId"] is None
+    assert set(data["studyId"]) == set(plot.study_id)
+
+    response = await test_client.patch(f"{PATH}/{plot.id}", json={"studyId": [maize_id]})
+    assert response.status_code == 200
+    assert response.json()["studyId"] == [maize_id]
+    assert response.json()["location"] == "Bay 4"
+
+    response = await test_client.patch(f"{PATH}/{plot.id}", json={"title": None})
+    assert response.status_code == 400
+    response = await test_client.patch(f"{PATH}/{plot.id}", json={"unknown": 1})
+    assert response.status_code == 400
+
+
+async def test_observation_units_bulk(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    maize_id = setup_observation_units.study_response.maize.study_response.json()["id"]
+    items = [
+        {"title": "Bulk 1", "studyId": [maize_id]},
+        {"title": "Bulk 2", "studyId": [str(uuid4())]},
+        {"title": "Bulk 3", "studyId": [maize_id]},
+    ]
+    response = await test_client.post(f"{PATH}/bulk", json=items, params={"chunkSize": 2})
+    assert response.status_code == 200
+    result = response.json()
+    assert [item["status"] for item in result["items"]] == [201, 422, 201]
+    assert (result["succeeded"], result["failed"]) == (2, 1)
+    first, third = result["items"][0]["id"], result["items"][2]["id"]
+    response = await test_client.get(PATH, params={"filter": f"id:in:{first},{third}"})
+    assert {item["title"] for item in response.json()["items"]} == {"Bulk 1", "Bulk 3"}
+    assert all(item["studyId"] == [maize_id] for item in response.json()["items"])
+
+    missing = str(uuid4())
+    items = [{"id": first, "location": "Bay 1"}, {"id": missing, "title": "Missing"}, {"id": third, "studyId": []}]
+    response = await test_client.patch(f"{PATH}/bulk", json=items)
+    assert [item["status"] for item in response.json()["items"]] == [200, 404, 200]
+    assert [item["id"] for item in response.json()["items"]] == [first, missing, third]
+    assert (await test_client.get(f"{PATH}/{first}")).json()["location"] == "Bay 1"
+    assert (await test_client.get(f"{PATH}/{third}")).json()["studyId"] == []
+
+    response = await test_client.request("DELETE", f"{PATH}/bulk", json=[first, third, missing])
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["items"]] == [200, 200, 404]
+    assert [item["id"] for item in response.json()["items"]] == [first, third, missing]
+
+
+async def test_observation_unit_missing_references_rejected(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    maize_id = setup_observation_units.study_response.maize.study_response.json()["id"]
+    missing_study, missing_facility = str(uuid4()), str(uuid4())
+    data = {"title": "Orphan", "studyId": [maize_id, missing_study], "facilityId": missing_facility}
+
+    response = await test_client.post(PATH, json=data)
+    assert response.status_code == 422
+    assert response.json()["extra"] == {"studyId": [missing_study], "facilityId": [missing_facility]}
+
+    plot = get_observation_unit_fixture(setup_observation_units.plot_894, PLOT_894)
+    response = await test_client.patch(f"{PATH}/{plot.id}/studies", json={"add": [missing_study]})
+    assert response.status_code == 422
+    assert response.json()["extra"] == {"studyId": [missing_study]}
+
+    # More ids than fit one IN list
+    missing_studies = sorted(str(uuid4()) for _ in range(1500))
+    response = await test_client.post(PATH, json={"title": "Orphan", "studyId": [maize_id, *missing_studies]})
+    assert response.status_code == 422
+    assert response.json()["extra"] == {"studyId": missing_studies}
+
+
+async def test_observation_units_included(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    page = (await test_client.get(PATH, params={"include": "observationUnitType,studies,parents"})).json()
+    items = page["items"]
+    included = page["included"]
+    type_ids = {item["observationUnitTypeId"] for item in items} - {None}
+    assert type_ids
+    assert sorted(item["id"] for item in included["observationUnitType"]) == sorted(type_ids)
+    study_ids = {id for item in items for id in item["studyId"]}
+    assert sorted(item["id"] for item in included["studies"]) == sorted(study_ids)
+    parent_ids = {id for item in items for id in item["parentId"]}
+    assert sorted(item["id"] for item in included["parents"]) == sorted(parent_ids)
+    assert (await test_client.get(PATH)).json()["included"] == {}
+
+    sparse = (await test_client.get(PATH, params={"fields": "title", "include": "observationUnitType"})).json()
+    assert sorted(item["id"] for item in sparse["included"]["observationUnitType"]) == sorted(type_ids)
+
+    assert (await test_client.get(PATH, params={"include": "unknown"})).status_code == 400
+
+
+async def test_observation_units_included_with_planned_loaders(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    with captured_statements() as plain:
+        await test_client.get(PATH)
+    with captured_statements() as statements:
+        page = (await test_client.get(PATH, params={"include": "facility,samples,events,children"})).json()
+    assert set(page["included"]) == {"facility", "samples", "events", "children"}
+    # One statement per relationship: the facilities by id, the collections joined from the page
+    by_id, *by_owner = (statement for statement in statements if statement not in plain)
+    assert "FROM facility_table" in by_id
+    assert " JOIN " not in by_id
+    assert len(by_owner) == 3
+    assert all(" JOIN " in statement for statement in by_owner)
+
+
+async def test_observation_units_queried_by_ids(
+    setup_observation_units: AllObservationUnitFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    items = (await test_client.get(PATH)).json()["items"]
+    ids = [item["id"] for item in reversed(items)]
+    # More ids than fit one IN list, with the real ones spread across chunks
+    body: dict[str, Any] = {"ids": [ids[0], *(str(uuid4()) for _ in range(1500)), *ids[1:]]}
+    response = await test_client.post(f"{PATH}/query", json=body)
+    assert response.status_code == 200
+    assert response.json() == list(reversed(items))
+
+    body = {"ids": ids, "filters": [f"title:eq:{PLOT_894.title}"], "fields": "title,studyId"}
+    (item,) = (await test_client.post(f"{PATH}/query", json=body)).json()
+    assert set(item) == {"id", "title", "studyId"}
+    assert item["title"] == PLOT_894.title
@@ -56,3 +56,13 @@ async def test_scanalyzer_created(setup_sample: AllSampleFixtureResponse, test_c
 
     fixture = get_sample_fixture(setup_sample.leafdisc_061440, LEAFDISC_061440)
     await validate_post(PATH, fixture.data, test_client, fixture.response)
+
+
+async def test_sample_page_matches_items(setup_sample: AllSampleFixtureResponse, test_client: AsyncTestClient) -> None:
+    page = (await test_client.get(PATH, params={"limit": 2})).json()
+    assert len(page["items"]) == 2
+    assert page["next"] is not None
+    for item in page["items"]:
+        assert item == (await test_client.get(f"{PATH}/{item['id']}")).json()
+    sparse = (await test_client.get(PATH, params={"limit": 2, "fields": "title"})).json()
+    assert sparse["items"] == [{"id": item["id"], "title": item["title"]} for item in page["items"]]
@@ -5,7 +5,7 @@ from httpx import Response
 from litestar.testing import AsyncTestClient
 
 from src.model import Study
-from tests.helpers import validate_get_not_exist, validate_post, validate_put
+from tests.helpers import captured_statements, validate_get_not_exist, validate_post, validate_put
 from tests.router.study.fixture import (
     BARLEY_PROJECT_STUDY,
     FIRST_STUDY,
@@ -69,3 +69,21 @@ async def test_delete_first_project_also_delete_first_and_second_studies(
     assert response.status_code == 204
     await validate_get_not_exist(PATH, test_client, first.id)
     await validate_get_not_exist(PATH, test_client, second.id)
+
+
+async def test_studies_included_with_planned_loaders(
+    setup_study: AllStudyFixtureResponse, test_client: AsyncTestClient
+) -> None:
+    with captured_statements() as plain:
+        await test_client.get(PATH)
+    with captured_statements() as statements:
+        page = (await test_client.get(PATH, params={"include": "investigation,observationUnit,experiments"})).json()
+    assert sorted(item["id"] for item in page["included"]["investigation"]) == sorted(
+        {item["investigationId"] for item in page["items"]}
+    )
+    # One statement per relationship: the shared investigations by id, the collections joined from the page
+    by_id, *by_owner = (statement for statement in statements if statement not in plain)
+    assert "FROM investigation_table" in by_id
+    assert " JOIN " not in by_id
+    assert len(by_owner) == 2
+    assert all(" JOIN " in statement for statement in by_owner)
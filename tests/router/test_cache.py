@@ -0,0 +1,134 @@
+import subprocess
+import sys
+
+from litestar.testing import AsyncTestClient
+
+
+async def test_unit_list_cached_until_write(test_client: AsyncTestClient) -> None:
+    await test_client.post("/unit", json={"name": "metre"})
+    first = await test_client.get("/unit")
+    second = await test_client.get("/unit", params={})
+    assert first.json() == second.json()
+    stats = (await test_client.get("/diagnostics/cache")).json()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    await test_client.post("/unit", json={"name": "second"})
+    names = {item["name"] for item in (await test_client.get("/unit")).json()["items"]}
+    assert names == {"metre", "second"}
+    assert (await test_client.get("/diagnostics/cache")).json()["misses"] == 2
+
+
+async def test_device_list_invalidated_by_vocabulary_delete(test_client: AsyncTestClient) -> None:
+    vocabulary = (await test_client.post("/vocabulary", json={"title": "Camera"})).json()
+    await test_client.post("/device", json={"name": "RGB", "deviceTypeId": vocabulary["id"]})
+    assert (await test_client.get("/device")).json()["items"][0]["deviceTypeId"] == vocabulary["id"]
+    # Deleting the vocabulary nulls the device column through ON DELETE SET NULL, without a write to device_table
+    await test_client.delete(f"/vocabulary/{vocabulary['id']}")
+    assert (await test_client.get("/device")).json()["items"][0]["deviceTypeId"] is None
+
+
+async def test_items_invalidated_on_both_ends_of_a_link(test_client: AsyncTestClient) -> None:
+    institution = (await test_client.post("/institution", json={"name": "APPN"})).json()
+    staff = (await test_client.post("/staff", json={"name": "Ann", "institutionId": []})).json()
+    assert (await test_client.get(f"/staff/{staff['id']}")).json()["institutionId"] == []
+    await test_client.get(f"/institution/{institution['id']}")
+    await test_client.get(f"/institution/{institution['id']}")
+    misses = (await test_client.get("/diagnostics/cache")).json()["misses"]
+
+    response = await test_client.patch(f"/staff/{staff['id']}", json={"institutionId": [institution["id"]]})
+    assert response.status_code == 200
+    assert (await test_client.get(f"/staff/{staff['id']}")).json()["institutionId"] == [institution["id"]]
+    await test_client.get(f"/institution/{institution['id']}")
+    assert (await test_client.get("/diagnostics/cache")).json()["misses"] == misses + 2
+
+
+async def cache_stats(test_client: AsyncTestClient) -> tuple[int, int]:
+    stats = (await test_client.get("/diagnostics/cache")).json()
+    return stats["hits"], stats["misses"]
+
+
+async def test_items_not_cached_without_opt_in(test_client: AsyncTestClient) -> None:
+    investigation = (await test_client.post("/investigation", json={"title": "Drought"})).json()
+    for _ in range(2):
+        assert (await test_client.get(f"/investigation/{investigation['id']}")).status_code == 200
+    assert await cache_stats(test_client) == (0, 0)
+
+
+async def test_link_change_keeps_other_items_cached(test_client: AsyncTestClient) -> None:
+    investigation = (await test_client.post("/investigation", json={"title": "Drought"})).json()
+    body = {"title": "Maize", "objective": "Yield", "startDate": "2024-01-01T00:00:00"}
+    study = (await test_client.post("/study", json={**body, "investigationId": investigation["id"]})).json()
+    first, second = [
+        (await test_client.post("/observationUnit", json={"title": title, "studyId": []})).json()
+        for title in ("Plot 1", "Plot 2")
+    ]
+    paths = [f"/observationUnit/{first['id']}", f"/observationUnit/{second['id']}", f"/study/{study['id']}"]
+    for path in paths:
+        assert (await test_client.get(path)).status_code == 200
+    assert await cache_stats(test_client) == (0, 3)
+
+    response = await test_client.patch(f"/observationUnit/{first['id']}/studies", json={"add": [study["id"]]})
+    assert response.status_code == 200
+    # Only the two ends of the new link are read again
+    assert (await test_client.get(paths[0])).json()["studyId"] == [study["id"]]
+    assert (await test_client.get(paths[1])).json()["studyId"] == []
+    await test_client.get(paths[2])
+    assert await cache_stats(test_client) == (1, 5)
+
+    response = await test_client.patch(paths[1], json={"title": "Plot 2b"})
+    assert response.status_code == 200
+    assert (await test_client.get(paths[1])).json()["title"] == "Plot 2b"
+    assert (await test_client.get(paths[0])).json()["studyId"] == [study["id"]]
+    assert await cache_stats(test_client) == (2, 6)
+
+
+async def test_item_invalidated_through_on_delete(test_client: AsyncTestClient) -> None:
+    vocabulary = (await test_client.post("/vocabulary", json={"title": "Camera"})).json()
+    device = (await test_client.post("/device", json={"name": "RGB", "deviceTypeId": vocabulary["id"]})).json()
+    assert (await test_client.get(f"/device/{device['id']}")).json()["deviceTypeId"] == vocabulary["id"]
+    # The device row changes through ON DELETE SET NULL, so every device item is read again
+    await test_client.delete(f"/vocabulary/{vocabulary['id']}")
+    assert (await test_client.get(f"/device/{device['id']}")).json()["deviceTypeId"] is None
+
+
+async def test_list_invalidated_by_write_of_another_process(test_client: AsyncTestClient) -> None:
+    await test_client.post("/unit", json={"name": "metre"})
+    await test_client.get("/unit")
+    # Another worker on the same file, with table versions of its own
+    script = (
+        "from sqlalchemy import create_engine\n"
+        "from sqlalchemy.orm import Session\n"
+        "from src.model import Unit\n"
+        "with Session(create_engine('sqlite:///test.sqlite')) as session, session.begin():\n"
+        "    session.add(Unit(name='second'))\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+    names = {item["name"] for item in (await test_client.get("/unit")).json()["items"]}
+    assert names == {"metre", "second"}
+
+
+async def test_item_invalidated_by_write_of_another_process(test_client: AsyncTestClient) -> None:
+    first, second = [(await test_client.post("/unit", json={"name": name})).json() for name in ("metre", "second")]
+    for item in (first, second):
+        await test_client.get(f"/unit/{item['id']}")
+    script = (
+        "from uuid import UUID\n"
+        "from sqlalchemy import create_engine\n"
+        "from sqlalchemy.orm import Session\n"
+        "from src.model import Unit\n"
+        "with Session(create_engine('sqlite:///test.sqlite')) as session, session.begin():\n"
+        f"    session.get(Unit, UUID('{first['id']}')).name = 'meter'\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+    assert (await test_client.get(f"/unit/{first['id']}")).json()["name"] == "meter"
+    assert (await test_client.get(f"/unit/{second['id']}")).json()["name"] == "second"
+    assert await cache_stats(test_client) == (1, 3)
+
+
+async def test_item_invalidated_by_delete_of_linked_item(test_client: AsyncTestClient) -> None:
+    parent = (await test_client.post("/observationUnit", json={"title": "Plot", "studyId": []})).json()
+    child = (await test_client.post("/observationUnit", json={"title": "Plant", "parentId": [parent["id"]]})).json()
+    assert (await test_client.get(f"/observationUnit/{child['id']}")).json()["parentId"] == [parent["id"]]
+    # The link goes with the parent through ON DELETE CASCADE
+    assert (await test_client.delete(f"/observationUnit/{parent['id']}")).status_code == 204
+    assert (await test_client.get(f"/observationUnit/{child['id']}")).json()["parentId"] == []
@@ -0,0 +1,11 @@
+from litestar.testing import AsyncTestClient
+
+
+async def test_sqlite_diagnostics(test_client: AsyncTestClient) -> None:
+    response = await test_client.get("/diagnostics/sqlite")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["profile"]["name"] == "development"
+    assert data["pragmas"]["journal_mode"] == "wal"
+    assert data["pragmas"]["query_only"] == 0
+    assert data["pragmas"]["busy_timeout"] == 5000
@@ -0,0 +1,17 @@
+from src.model import Vocabulary
+from src.router.utils.dto import DTOGenerator, get_dto
+
+
+def test_dto_classes_shared_per_config() -> None:
+    first, second = DTOGenerator[Vocabulary](), DTOGenerator[Vocabulary]()
+    assert first.read_dto is first.read_dto is second.read_dto
+    assert first.write_dto is second.write_dto
+    assert first.read_dto is not first.write_dto
+    assert get_dto(Vocabulary, exclude={"id"}) is get_dto(Vocabulary, exclude={"id"})
+    assert get_dto(Vocabulary, exclude={"id"}) is not get_dto(Vocabulary)
+
+
+def test_dto_config_with_lists() -> None:
+    dto = get_dto(Vocabulary, exclude=["id", "created_at"], rename_fields={"title": "name"})
+    assert get_dto(Vocabulary, exclude=["id", "created_at"], rename_fields={"title": "name"}) is dto
+    assert get_dto(Vocabulary, exclude=["id"], rename_fields={"title": "name"}) is not dto
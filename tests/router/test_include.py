@@ -0,0 +1,73 @@
+from typing import Any
+
+import pytest
+from litestar.testing import AsyncTestClient
+from sqlalchemy import inspect
+
+from src.router import (
+    BiologicalMaterialController,
+    DataFileController,
+    DeviceController,
+    EnvironmentController,
+    EventController,
+    ExperimentalFactorController,
+    ExperimentController,
+    FacilityController,
+    InstitutionController,
+    InvestigationController,
+    MethodController,
+    ObservationUnitController,
+    ObservedVariableController,
+    SampleController,
+    StaffController,
+    StudyController,
+    UnitController,
+    VocabularyController,
+)
+from src.router.base import BaseController
+from src.router.utils.query import to_camel
+
+CONTROLLERS: list[type[BaseController[Any]]] = [
+    BiologicalMaterialController,
+    DataFileController,
+    DeviceController,
+    EnvironmentController,
+    EventController,
+    ExperimentalFactorController,
+    ExperimentController,
+    FacilityController,
+    InstitutionController,
+    InvestigationController,
+    MethodController,
+    ObservationUnitController,
+    ObservedVariableController,
+    SampleController,
+    StaffController,
+    StudyController,
+    UnitController,
+    VocabularyController,
+]
+
+
+@pytest.mark.usefixtures(
+    "setup_sample",
+    "setup_event",
+    "setup_environment",
+    "setup_data_file",
+    "setup_experiment",
+    "setup_method",
+    "setup_observed_variable",
+    "setup_staff",
+    "setup_unit",
+)
+@pytest.mark.parametrize("controller", CONTROLLERS, ids=lambda controller: controller.path)
+async def test_every_relationship_included_with_planned_loaders(
+    controller: type[BaseController[Any]], test_client: AsyncTestClient
+) -> None:
+    # Most controllers declare no loaders, so this covers the planner's default under raise_on_sql
+    names = [to_camel(prop.key) for prop in inspect(controller.model_type).relationships]
+    response = await test_client.get(controller.path, params={"include": ",".join(names)})
+    assert response.status_code == 200, response.text
+    page = response.json()
+    assert page["items"]
+    assert sorted(page["included"]) == sorted(names)
@@ -0,0 +1,34 @@
+from datetime import UTC, datetime
+from itertools import combinations, islice
+from typing import Any, cast
+from uuid import uuid4
+
+import msgspec
+
+from src.model import Facility, Vocabulary
+from src.router.utils.query import MEMOIZE_SIZE
+from src.router.utils.struct import model_struct, parse_fields, partial_struct, to_struct
+
+
+def test_model_struct_encodes_camel_case() -> None:
+    struct = model_struct(Vocabulary)
+    assert model_struct(Vocabulary) is struct
+    now = datetime.now(UTC)
+    item = Vocabulary(id=uuid4(), title="Leaf", external_reference="PO:0025034", created_at=now, updated_at=now)
+    encoded = msgspec.json.decode(msgspec.json.encode(to_struct(struct, item)))
+    assert encoded["externalReference"] == "PO:0025034"
+    assert "external_reference" not in encoded
+
+
+def test_partial_structs_are_bounded() -> None:
+    struct = model_struct(Facility)
+    names = [name for name in struct.__struct_fields__ if name != "id"]
+    subsets = (subset for size in range(1, len(names) + 1) for subset in combinations(names, size))
+    for subset in islice(subsets, 2 * MEMOIZE_SIZE):
+        partial_struct(struct, parse_fields(struct, ",".join(subset)))
+    assert cast("Any", partial_struct).cache_info().currsize == MEMOIZE_SIZE
+    # The same subset in another order or spelling is the same key
+    struct = model_struct(Vocabulary)
+    assert partial_struct(struct, parse_fields(struct, "title,externalReference")) is partial_struct(
+        struct, parse_fields(struct, "external_reference, title")
+    )
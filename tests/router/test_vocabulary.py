@@ -0,0 +1,38 @@
+from typing import Any, cast
+
+from litestar.testing import AsyncTestClient
+
+from src.router.base import _select_by_id, _select_page
+
+
+async def test_vocabulary_list_filters(test_client: AsyncTestClient) -> None:
+    leaf = (await test_client.post("/vocabulary", json={"title": "Leaf", "externalReference": "PO:0025034"})).json()
+    root = (await test_client.post("/vocabulary", json={"title": "Root", "namespace": "PO"})).json()
+    await test_client.post("/vocabulary", json={"title": "Stem", "namespace": "PO"})
+
+    async def titles(params: dict[str, str]) -> list[str]:
+        response = await test_client.get("/vocabulary", params=params)
+        assert response.status_code == 200
+        return sorted(item["title"] for item in response.json()["items"])
+
+    assert await titles({"external_reference": "PO:0025034"}) == ["Leaf"]
+    assert await titles({"namespace": "PO"}) == ["Root", "Stem"]
+    assert await titles({"namespace": "PO", "filter": "title:eq:Stem"}) == ["Stem"]
+    # The parameters of the base list handler still apply
+    assert await titles({"namespace": "PO", "id": root["id"]}) == ["Root"]
+    assert await titles({"id": leaf["id"], "fields": "title"}) == ["Leaf"]
+
+
+async def test_statements_memoized_per_shape(test_client: AsyncTestClient) -> None:
+    leaf = (await test_client.post("/vocabulary", json={"title": "Leaf", "namespace": "PO"})).json()
+    root = (await test_client.post("/vocabulary", json={"title": "Root"})).json()
+    for memo in (_select_page, _select_by_id):
+        cast("Any", memo).cache_clear()
+    queries: list[dict[str, str]] = [{}, {"namespace": "PO"}, {"id": leaf["id"]}, {"id": root["id"], "fields": "title"}]
+    for params in queries:
+        assert (await test_client.get("/vocabulary", params=params)).status_code == 200
+    for id in (leaf["id"], root["id"]):
+        assert (await test_client.get(f"/vocabulary/{id}", params={"fields": "title"})).status_code == 200
+    # Filter values, ids and selected fields are added per request, so only the table and order make a new statement
+    assert cast("Any", _select_page).cache_info().currsize == 1
+    assert cast("Any", _select_by_id).cache_info().currsize == 1
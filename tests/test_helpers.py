@@ -0,0 +1,184 @@
+import asyncio
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from httpx import ASGITransport, AsyncClient
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from litestar.types import Message, ReceiveMessage
+from sqlalchemy import Connection, event, insert, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.helpers import (
+    BULK_IMPORT,
+    READ_ONLY,
+    GroupCommitPlugin,
+    SQLiteProfile,
+    SQLiteReaderPlugin,
+    create_db_config,
+    get_sqlite_profile,
+    provide_transaction,
+    read_pragmas,
+)
+from src.model import Base, Vocabulary
+from src.model.version import table_version_table
+from src.router import InvestigationController, VocabularyController
+from src.router.utils.cache import LRUStore
+
+
+async def test_reader_is_read_only_and_sees_writes(tmp_path: Path) -> None:
+    db_config = create_db_config(str(tmp_path / "test.sqlite"))
+    writer = db_config.get_engine()
+    async with writer.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        assert (await connection.scalar(text("PRAGMA journal_mode"))) == "wal"
+    reader = SQLiteReaderPlugin(str(tmp_path / "test.sqlite"))
+
+    async with AsyncSession(writer) as session, session.begin():
+        await session.execute(insert(Vocabulary).values(title="Leaf"))
+    async with reader.session_maker() as session:
+        assert not session.autoflush
+        assert (await session.scalars(select(Vocabulary.title))).all() == ["Leaf"]
+        with pytest.raises(OperationalError):
+            await session.execute(insert(Vocabulary).values(title="Root"))
+    await reader.engine.dispose()
+    await writer.dispose()
+
+
+async def test_group_commit_batches_concurrent_writes(tmp_path: Path) -> None:
+    path = str(tmp_path / "test.sqlite")
+    db_config = create_db_config(path)
+    app = Litestar(
+        [InvestigationController],
+        dependencies={"transaction": provide_transaction},
+        plugins=[SQLAlchemyPlugin(db_config), SQLiteReaderPlugin(path), GroupCommitPlugin(window=0.05)],
+    )
+    async with AsyncTestClient(app=app) as client:
+        commits: list[Connection] = []
+        event.listen(app.state[db_config.engine_app_state_key].sync_engine, "commit", commits.append)
+        titles = ["First", "Second", "Third", "First"]
+        # The test client handles one request at a time, so the concurrent posts go straight to the app
+        async with AsyncClient(transport=ASGITransport(cast("Any", app)), base_url="http://testserver") as concurrent:
+            responses = await asyncio.gather(*(concurrent.post("/investigation", json={"title": t}) for t in titles))
+        assert [response.status_code for response in responses].count(201) == 3
+        assert [response.status_code for response in responses].count(409) == 1
+        assert len(commits) == 1
+        page = (await client.get("/investigation")).json()
+        assert sorted(item["title"] for item in page["items"]) == ["First", "Second", "Third"]
+        # The batch bumps the stored version of each written table once, rather than once per request
+        async with app.state[db_config.engine_app_state_key].connect() as connection:
+            stmt = select(table_version_table.c.version).where(table_version_table.c.name == "investigation_table")
+            assert await connection.scalar(stmt) == 1
+
+
+def test_sqlite_profile_is_validated() -> None:
+    with pytest.raises(ValueError, match="synchronous"):
+        SQLiteProfile(name="bad", synchronous="SOMETIMES")
+    with pytest.raises(ValueError, match="Unknown SQLite profile"):
+        get_sqlite_profile("fast")
+
+
+async def test_sqlite_profile_applied(tmp_path: Path) -> None:
+    path = str(tmp_path / "test.sqlite")
+    writer = create_db_config(path, profile=BULK_IMPORT).get_engine()
+    async with writer.connect() as connection:
+        pragmas = await read_pragmas(connection)
+    assert pragmas["synchronous"] == 0
+    assert pragmas["cache_size"] == BULK_IMPORT.cache_size
+    assert pragmas["busy_timeout"] == 30000
+    reader = SQLiteReaderPlugin(path, BULK_IMPORT)
+    await reader.check_profile()
+    async with reader.engine.connect() as connection:
+        assert BULK_IMPORT.mismatches(await read_pragmas(connection)) == {}
+        assert SQLiteProfile(name="other").mismatches(await read_pragmas(connection))
+    await reader.engine.dispose()
+    await writer.dispose()
+
+
+async def test_read_only_profile_sets_query_only(tmp_path: Path) -> None:
+    path = str(tmp_path / "test.sqlite")
+    schema = create_db_config(path).get_engine()
+    async with schema.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await schema.dispose()
+    db_config = create_db_config(path, profile=READ_ONLY)
+    assert not db_config.create_all
+    engine = db_config.get_engine()
+    async with engine.connect() as connection:
+        assert (await read_pragmas(connection))["query_only"] == 1
+        with pytest.raises(OperationalError, match="readonly"):
+            await connection.execute(insert(Vocabulary).values(title="Leaf"))
+    await engine.dispose()
+
+
+async def test_read_only_profile_without_table_versions(tmp_path: Path) -> None:
+    path = str(tmp_path / "test.sqlite")
+    schema = create_db_config(path).get_engine()
+    async with schema.begin() as connection:
+        # A database created before the table versions were stored
+        tables = [table for table in Base.metadata.sorted_tables if table is not table_version_table]
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+        await connection.execute(insert(Vocabulary).values(title="Leaf"))
+    await schema.dispose()
+    reader = SQLiteReaderPlugin(path, READ_ONLY)
+    assert await reader.read_table_versions() is None
+    app = Litestar(
+        [VocabularyController],
+        plugins=[SQLAlchemyPlugin(create_db_config(path, profile=READ_ONLY)), reader],
+        stores={"response_cache": LRUStore()},
+    )
+    async with AsyncTestClient(app=app) as client:
+        assert await reader.read_table_versions() is None
+        for _ in range(2):
+            response = await client.get("/vocabulary")
+            assert response.status_code == 200
+            assert [item["title"] for item in response.json()["items"]] == ["Leaf"]
+        assert app.stores.get("response_cache").stats().hits == 1  # type: ignore[attr-defined]
+
+
+async def test_open_stream_leaves_reader_pool_free(tmp_path: Path) -> None:
+    path = str(tmp_path / "test.sqlite")
+    profile = SQLiteProfile(name="narrow", reader_pool_size=1, stream_pool_size=1)
+    app = Litestar(
+        [VocabularyController],
+        dependencies={"transaction": provide_transaction},
+        plugins=[SQLAlchemyPlugin(create_db_config(path, profile=profile)), SQLiteReaderPlugin(path, profile)],
+    )
+    async with AsyncTestClient(app=app) as client:
+        assert (await client.post("/vocabulary", json={"title": "Leaf"})).status_code == 201
+        # A client that reads the first chunk of a stream and then stops reading
+        first_chunk, release = asyncio.Event(), asyncio.Event()
+
+        async def receive() -> ReceiveMessage:
+            await release.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_chunk.set()
+                await release.wait()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/vocabulary/stream",
+            "raw_path": b"/vocabulary/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "state": {},
+        }
+        stream = asyncio.create_task(app(cast("Any", scope), receive, send))
+        await asyncio.wait_for(first_chunk.wait(), 5)
+        response = await asyncio.wait_for(client.get("/vocabulary"), 5)
+        assert [item["title"] for item in response.json()["items"]] == ["Leaf"]
+        release.set()
+        await stream